@@ -9,16 +9,122 @@ quotes actually appear in the referenced publications.
 import argparse
 import yaml
 import asyncio
+import heapq
+import json
+import os
 import time
-import requests
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+import httpx
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass, replace
 import re
 import sys
+from pathlib import Path
+from urllib.parse import quote
 from aurelian.utils.pubmed_utils import get_pmid_text
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader  # libyaml-backed, much faster
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
 
-@dataclass
+try:
+    import ahocorasick  # optional: single-pass disease keyword scan
+except ImportError:
+    ahocorasick = None
+
+try:
+    import h2  # noqa: F401  optional: lets httpx multiplex requests over HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import uvloop  # optional: faster event loop for the many small HTTP calls
+except ImportError:
+    uvloop = None
+
+# Maximum number of supporting text entries validated (and fetched) at once
+MAX_CONCURRENT_VALIDATIONS = 8
+
+# Maximum number of distinct papers fetched at once by PMIDFetcher.prefetch
+MAX_CONCURRENT_FETCHES = 8
+
+# Maximum number of papers requested from NCBI at once, whoever asks; NCBI
+# rate-limits clients without an API key to a few requests per second
+MAX_CONCURRENT_PUBMED_REQUESTS = 3
+
+# Annotation sections containing supporting text, in report order
+ANNOTATION_SECTIONS = ['phenotypic_features', 'inheritance', 'clinical_course', 'diagnostic_methodology']
+
+# Fetched paper text is kept on disk between runs; PMID content rarely changes
+DEFAULT_CACHE_DIR = "~/.cache/annotation_validator/pmid"
+CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+
+# Resolved DOIs are immutable, so their CrossRef titles are kept without expiry
+DEFAULT_DOI_CACHE_DIR = "~/.cache/annotation_validator/doi"
+
+# Transient HTTP failures are retried with exponential backoff
+HTTP_RETRIES = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_BACKOFF = 0.3  # seconds before the first retry, doubling after each
+
+
+def _make_client() -> httpx.AsyncClient:
+    """Create an async HTTP client with connection pooling (and HTTP/2 if h2 is installed)."""
+    transport = httpx.AsyncHTTPTransport(
+        retries=HTTP_RETRIES,  # connection errors only
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT_VALIDATIONS * 2, max_keepalive_connections=20),
+    )
+    return httpx.AsyncClient(headers={"Accept": "application/json"}, timeout=10, transport=transport)
+
+
+async def _get_with_retries(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """GET a URL, retrying transient HTTP statuses with exponential backoff."""
+    for attempt in range(HTTP_RETRIES + 1):
+        response = await client.get(url)
+        if response.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+            return response
+        await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+
+def _get_with_retries_sync(url: str) -> httpx.Response:
+    """Blocking counterpart of _get_with_retries, for the rare synchronous lookups."""
+    transport = httpx.HTTPTransport(retries=HTTP_RETRIES)  # connection errors only
+    with httpx.Client(headers={"Accept": "application/json"}, timeout=10, transport=transport) as client:
+        for attempt in range(HTTP_RETRIES + 1):
+            response = client.get(url)
+            if response.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                return response
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a cache file via a temporary file and rename, so readers never see a partial file."""
+    tmp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(text, encoding="utf-8")
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+# Text normalization tables, built once
+_WS_RE = re.compile(r'\s+')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_KEYWORD_SPLIT_RE = re.compile(r'[,\s\-_]+')
+_WORD_RE = re.compile(r'\b\w+\b')
+_KEYWORD_STOP_WORDS = frozenset({'syndrome', 'disease', 'disorder', 'the', 'of', 'and', 'or', 'a', 'an'})
+_TITLE_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+                               'framework', 'criteria'})
+_QUOTE_TABLE = str.maketrans({
+    '\u201c': '"', '\u201d': '"',  # curly double quotes
+    '\u2018': "'", '\u2019': "'",  # curly single quotes
+})
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating a single supporting text entry."""
     hpo_id: str
@@ -34,6 +140,16 @@ class ValidationResult:
     suggestions: Optional[List[str]] = None
 
 
+@dataclass
+class PreparedContent:
+    """Publication content plus the derived forms used for matching."""
+    raw: str
+    normalized: str
+    sentences: List[str]
+    sentence_tokens: List[frozenset]  # normalized word set per sentence
+    relevance: Optional[Tuple[bool, float]] = None  # disease relevance, filled on first use
+
+
 @dataclass 
 class IdentifierValidationResult:
     """Result of validating a method identifier."""
@@ -48,11 +164,43 @@ class IdentifierValidationResult:
 class IdentifierValidator:
     """Validate method identifiers like DOI, LOINC, CPT codes."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, cache_dir: str = DEFAULT_DOI_CACHE_DIR):
         self.cache = {}
+        self.client = client
+        self.cache_dir = Path(cache_dir).expanduser()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Warning: Could not create cache directory {self.cache_dir}: {e}")
+    
+    def _get_cache_file(self, doi: str) -> Path:
+        """Get cache file path for a DOI."""
+        return self.cache_dir / f"{quote(doi, safe='')}.json"
+    
+    def _load_from_cache(self, doi: str) -> Optional[Dict[str, Any]]:
+        """Load a resolved DOI from the disk cache if present."""
+        try:
+            return json.loads(self._get_cache_file(doi).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Could not load cache for DOI {doi}: {e}")
+            return None
+    
+    def _save_to_cache(self, doi: str, data: Dict[str, Any]) -> None:
+        """Save a resolved DOI to the disk cache."""
+        try:
+            _write_atomic(self._get_cache_file(doi), json.dumps(data))
+        except Exception as e:
+            print(f"Warning: Could not save cache for DOI {doi}: {e}")
     
     async def validate_doi(self, method_name: str, doi: str) -> IdentifierValidationResult:
         """Validate a DOI and check if title matches method name."""
+        if doi not in self.cache:
+            # Only successful lookups are persisted; failures may be transient
+            cached = self._load_from_cache(doi)
+            if cached is not None:
+                self.cache[doi] = cached
         if doi in self.cache:
             cached = self.cache[doi]
             return IdentifierValidationResult(
@@ -67,13 +215,18 @@ class IdentifierValidator:
         try:
             # Use CrossRef API to validate DOI
             url = f"https://api.crossref.org/works/{doi}"
-            response = await asyncio.to_thread(requests.get, url, timeout=10)
+            if self.client is not None:
+                response = await _get_with_retries(self.client, url)
+            else:
+                async with _make_client() as client:
+                    response = await _get_with_retries(client, url)
             
             if response.status_code == 200:
                 data = response.json()
                 title = data['message']['title'][0] if data['message'].get('title') else None
                 
                 self.cache[doi] = {'valid': True, 'title': title}
+                self._save_to_cache(doi, self.cache[doi])
                 
                 title_match = self._check_title_match(method_name, title)
                 
@@ -121,13 +274,12 @@ class IdentifierValidator:
         title_normalized = retrieved_title.lower().strip()
         
         # Check for key terms from method name in title
-        method_words = set(re.findall(r'\b\w+\b', method_normalized))
-        title_words = set(re.findall(r'\b\w+\b', title_normalized))
+        method_words = set(_WORD_RE.findall(method_normalized))
+        title_words = set(_WORD_RE.findall(title_normalized))
         
         # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'framework', 'criteria'}
-        method_words -= stop_words
-        title_words -= stop_words
+        method_words -= _TITLE_STOP_WORDS
+        title_words -= _TITLE_STOP_WORDS
         
         # Check if significant overlap exists
         if len(method_words) == 0:
@@ -173,19 +325,81 @@ class IdentifierValidator:
 class PMIDFetcher:
     """Fetch publication content using aurelian's pubmed utilities."""
     
-    def __init__(self):
-        self.cache = {}
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, cache_max_age: float = CACHE_MAX_AGE,
+                 max_pubmed_requests: int = MAX_CONCURRENT_PUBMED_REQUESTS):
+        # PMID -> fetch task, so concurrent requests for a PMID share one fetch
+        self.cache: Dict[str, asyncio.Task] = {}
+        # Disk cache hits bypass this; only network fetches are throttled
+        self._pubmed_semaphore = asyncio.Semaphore(max_pubmed_requests)
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_max_age = cache_max_age
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Warning: Could not create cache directory {self.cache_dir}: {e}")
+    
+    def _get_cache_file(self, pmid: str) -> Path:
+        """Get cache file path for a PMID."""
+        clean_pmid = pmid.replace("PMID:", "")
+        return self.cache_dir / f"PMID_{clean_pmid}.txt"
+    
+    def _load_from_cache(self, pmid: str) -> Optional[str]:
+        """Load paper content from the disk cache if present and not expired."""
+        cache_file = self._get_cache_file(pmid)
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_max_age:
+                return None
+            return cache_file.read_text(encoding="utf-8") or None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Could not load cache for {pmid}: {e}")
+            return None
+    
+    def _save_to_cache(self, pmid: str, content: str) -> None:
+        """Save paper content to the disk cache."""
+        try:
+            _write_atomic(self._get_cache_file(pmid), content)
+        except Exception as e:
+            print(f"Warning: Could not save cache for {pmid}: {e}")
     
     async def fetch_content(self, pmid: str) -> Optional[str]:
-        """Fetch paper content using aurelian's get_pmid_text."""
-        if pmid in self.cache:
-            return self.cache[pmid]
+        """Fetch paper content, reusing any in-flight or completed fetch."""
+        task = self.cache.get(pmid)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_content(pmid))
+            self.cache[pmid] = task
+        
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        content = await asyncio.shield(task)
+        if content is None and self.cache.get(pmid) is task:
+            # Don't cache failures; a later call may succeed
+            del self.cache[pmid]
+        return content
+    
+    async def prefetch(self, pmids: Iterable[str], max_concurrency: int = MAX_CONCURRENT_FETCHES) -> Dict[str, Optional[str]]:
+        """Fetch a batch of PMIDs concurrently, warming the cache for fetch_content."""
+        unique_pmids = list(dict.fromkeys(pmids))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_one(pmid: str) -> Optional[str]:
+            async with semaphore:
+                return await self.fetch_content(pmid)
         
+        contents = await asyncio.gather(*(fetch_one(pmid) for pmid in unique_pmids))
+        return dict(zip(unique_pmids, contents))
+    
+    async def _fetch_content(self, pmid: str) -> Optional[str]:
+        """Fetch paper content from the disk cache or aurelian's get_pmid_text."""
         try:
-            # Use aurelian's get_pmid_text which handles full text + fallback to abstract
-            content = await asyncio.to_thread(get_pmid_text, pmid)
+            content = await asyncio.to_thread(self._load_from_cache, pmid)
+            if content is None:
+                async with self._pubmed_semaphore:
+                    # Use aurelian's get_pmid_text which handles full text + fallback to abstract
+                    content = await asyncio.to_thread(get_pmid_text, pmid)
+                if content:
+                    await asyncio.to_thread(self._save_to_cache, pmid, content)
             if content:
-                self.cache[pmid] = content
                 return content
             else:
                 print(f"Warning: Could not fetch content for {pmid}")
@@ -196,99 +410,191 @@ class PMIDFetcher:
             return None
 
 
+# Disease ID -> synonyms from Monarch; only successful lookups are stored
+_DISEASE_SYNONYMS: Dict[str, Tuple[str, ...]] = {}
+
+
+def _monarch_entity_url(disease_id: str) -> str:
+    return f"https://api.monarchinitiative.org/v3/api/entity/{disease_id}"
+
+
+def _parse_disease_synonyms(data: Dict[str, Any]) -> Tuple[str, ...]:
+    """Extract normalized synonyms from a Monarch entity response."""
+    synonyms = []
+    
+    # Extract synonyms from the response
+    if 'synonyms' in data:
+        synonyms.extend([syn.get('val', '') for syn in data['synonyms'] if syn.get('val')])
+    
+    # Also check for alternative names in other fields
+    if 'name' in data:
+        synonyms.append(data['name'])
+    
+    # Clean and normalize synonyms
+    clean_synonyms = []
+    for syn in synonyms:
+        if syn and isinstance(syn, str) and syn.strip():
+            clean_synonyms.append(syn.lower().strip())
+    
+    return tuple(set(clean_synonyms))  # Remove duplicates
+
+
+def _fetch_disease_synonyms(disease_id: str) -> Tuple[str, ...]:
+    """Fetch disease synonyms from Monarch API.
+    
+    Results are memoized per disease ID. Errors propagate (and are therefore
+    not cached) so the caller can decide how to report them.
+    """
+    if disease_id not in _DISEASE_SYNONYMS:
+        response = _get_with_retries_sync(_monarch_entity_url(disease_id))
+        response.raise_for_status()
+        _DISEASE_SYNONYMS[disease_id] = _parse_disease_synonyms(response.json())
+    return _DISEASE_SYNONYMS[disease_id]
+
+
+async def _afetch_disease_synonyms(client: httpx.AsyncClient, disease_id: str) -> Tuple[str, ...]:
+    """Async variant of _fetch_disease_synonyms, sharing its memo."""
+    if disease_id not in _DISEASE_SYNONYMS:
+        response = await _get_with_retries(client, _monarch_entity_url(disease_id))
+        response.raise_for_status()
+        _DISEASE_SYNONYMS[disease_id] = _parse_disease_synonyms(response.json())
+    return _DISEASE_SYNONYMS[disease_id]
+
+
 class TextValidator:
     """Validate supporting text against publication content."""
     
-    def __init__(self, fetcher: PMIDFetcher, disease_name: str = "", disease_id: str = ""):
+    def __init__(self, fetcher: PMIDFetcher, disease_name: str = "", disease_id: str = "",
+                 synonyms: Optional[List[str]] = None):
         self.fetcher = fetcher
         self.disease_name = disease_name
         self.disease_id = disease_id
-        self.disease_keywords = self._extract_disease_keywords(disease_name, disease_id)
+        if synonyms is None:
+            synonyms = self._fetch_disease_synonyms(disease_id)
+        self.disease_keywords = self._extract_disease_keywords(disease_name, synonyms)
+        self._keyword_automaton = self._build_keyword_automaton(self.disease_keywords)
+        # Reference -> normalized content and sentences, built once per paper
+        self._prepared: Dict[str, PreparedContent] = {}
+    
+    @classmethod
+    async def create(cls, fetcher: PMIDFetcher, disease_name: str = "", disease_id: str = "",
+                     client: Optional[httpx.AsyncClient] = None) -> "TextValidator":
+        """Create a validator, fetching disease synonyms without blocking the event loop."""
+        synonyms = await cls._afetch_disease_synonyms(disease_id, client)
+        return cls(fetcher, disease_name, disease_id, synonyms=synonyms)
     
-    def _fetch_disease_synonyms(self, disease_id: str) -> List[str]:
-        """Fetch disease synonyms from Monarch API."""
+    @staticmethod
+    def _fetch_disease_synonyms(disease_id: str) -> List[str]:
+        """Fetch disease synonyms from Monarch API, returning [] on failure."""
         if not disease_id:
             return []
         
         try:
-            url = f"https://api.monarchinitiative.org/v3/api/entity/{disease_id}"
-            response = requests.get(url)
-            response.raise_for_status()
-            
-            data = response.json()
-            synonyms = []
-            
-            # Extract synonyms from the response
-            if 'synonyms' in data:
-                synonyms.extend([syn.get('val', '') for syn in data['synonyms'] if syn.get('val')])
-            
-            # Also check for alternative names in other fields
-            if 'name' in data:
-                synonyms.append(data['name'])
-            
-            # Clean and normalize synonyms
-            clean_synonyms = []
-            for syn in synonyms:
-                if syn and isinstance(syn, str):
-                    clean_synonyms.append(syn.lower().strip())
-            
-            return list(set(clean_synonyms))  # Remove duplicates
-            
+            return list(_fetch_disease_synonyms(disease_id))
+        except Exception as e:
+            print(f"Warning: Could not fetch synonyms for {disease_id}: {e}")
+            return []
+    
+    @staticmethod
+    async def _afetch_disease_synonyms(disease_id: str, client: Optional[httpx.AsyncClient] = None) -> List[str]:
+        """Async variant of _fetch_disease_synonyms, returning [] on failure."""
+        if not disease_id:
+            return []
+        
+        try:
+            if client is not None:
+                return list(await _afetch_disease_synonyms(client, disease_id))
+            async with _make_client() as client:
+                return list(await _afetch_disease_synonyms(client, disease_id))
         except Exception as e:
             print(f"Warning: Could not fetch synonyms for {disease_id}: {e}")
             return []
     
-    def _extract_disease_keywords(self, disease_name: str, disease_id: str = "") -> List[str]:
+    def _extract_disease_keywords(self, disease_name: str, synonyms: List[str]) -> List[str]:
         """Extract key terms from disease name and synonyms for relevance checking."""
-        keywords = []
+        keywords = set()  # Accumulate into a set to remove duplicates
         
         # Start with disease name if provided
         if disease_name:
-            # Split on common separators and normalize
-            words = re.split(r'[,\s\-_]+', disease_name.lower())
-            
-            # Filter out common words
-            stop_words = {'syndrome', 'disease', 'disorder', 'the', 'of', 'and', 'or', 'a', 'an'}
-            keywords.extend([word for word in words if word and word not in stop_words and len(word) > 2])
+            keywords.update(self._significant_words(disease_name))
             
             # Add the full disease name (normalized)
-            keywords.append(disease_name.lower())
+            keywords.add(disease_name.lower())
         
-        # Fetch and add synonyms from Monarch API
-        if disease_id:
-            synonyms = self._fetch_disease_synonyms(disease_id)
-            keywords.extend(synonyms)
+        # Add synonyms from Monarch API
+        if synonyms:
+            keywords.update(synonyms)
             
             # Also extract words from synonyms
             for synonym in synonyms:
-                words = re.split(r'[,\s\-_]+', synonym.lower())
-                stop_words = {'syndrome', 'disease', 'disorder', 'the', 'of', 'and', 'or', 'a', 'an'}
-                keywords.extend([word for word in words if word and word not in stop_words and len(word) > 2])
+                keywords.update(self._significant_words(synonym))
         
-        return list(set(keywords))  # Remove duplicates
+        return list(keywords)
+    
+    @staticmethod
+    def _significant_words(name: str) -> List[str]:
+        """Split a name on common separators and drop stop words and short words."""
+        return [word for word in _KEYWORD_SPLIT_RE.split(name.lower())
+                if word and word not in _KEYWORD_STOP_WORDS and len(word) > 2]
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords: List[str]):
+        """Build an Aho-Corasick automaton over the keywords, if pyahocorasick is installed."""
+        if ahocorasick is None or not keywords:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def prepare_content(self, content: str) -> PreparedContent:
+        """Normalize content and split it into candidate sentences."""
+        sentences = []
+        for sentence in _SENTENCE_SPLIT_RE.split(content):
+            sentence = sentence.strip()
+            if len(sentence) >= 10:  # Skip very short sentences
+                sentences.append(sentence)
+        sentence_tokens = [frozenset(self.normalize_text(sentence).split()) for sentence in sentences]
+        return PreparedContent(
+            raw=content,
+            normalized=self.normalize_text(content),
+            sentences=sentences,
+            sentence_tokens=sentence_tokens,
+        )
     
-    def check_disease_relevance(self, content: str) -> tuple[bool, float]:
+    def _prepare(self, reference: str, content: str) -> PreparedContent:
+        """Return the prepared form of a reference's content, computing it once."""
+        prepared = self._prepared.get(reference)
+        if prepared is None or prepared.raw is not content:
+            prepared = self.prepare_content(content)
+            self._prepared[reference] = prepared
+        return prepared
+    
+    def check_disease_relevance(self, content: str, prepared: Optional[PreparedContent] = None) -> tuple[bool, float]:
         """Check if publication content is relevant to the disease."""
         if not self.disease_keywords:
             return True, 1.0  # No keywords to check against
         
-        normalized_content = self.normalize_text(content)
+        normalized_content = prepared.normalized if prepared else self.normalize_text(content)
         
         # Count keyword matches
-        matches = 0
         total_keywords = len(self.disease_keywords)
         
-        for keyword in self.disease_keywords:
-            if keyword in normalized_content:
-                matches += 1
+        if self._keyword_automaton is not None:
+            # One pass over the content finds every keyword occurrence
+            matched = {keyword for _, keyword in self._keyword_automaton.iter(normalized_content)}
+        else:
+            matched = {keyword for keyword in self.disease_keywords if keyword in normalized_content}
+        matches = len(matched)
         
         relevance_score = matches / total_keywords if total_keywords > 0 else 0.0
         
         # Consider relevant if at least 20% of keywords match, or if key disease terms found
         is_relevant = relevance_score >= 0.2
         
-        # Boost relevance for exact disease name matches
-        if self.disease_name and self.disease_name.lower() in normalized_content:
+        # Boost relevance for exact disease name matches (the full name is one of the keywords)
+        if self.disease_name and self.disease_name.lower() in matched:
             is_relevant = True
             relevance_score = max(relevance_score, 0.8)
         
@@ -297,10 +603,7 @@ class TextValidator:
     def normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
         # Remove extra whitespace, normalize quotes, etc.
-        text = re.sub(r'\s+', ' ', text.strip())
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-        return text.lower()
+        return _WS_RE.sub(' ', text.strip()).translate(_QUOTE_TABLE).lower()
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate simple similarity score between two texts."""
@@ -316,46 +619,87 @@ class TextValidator:
         
         return len(intersection) / len(union)
     
-    def find_text_in_content(self, supporting_text: str, content: str, threshold: float = 0.8) -> tuple[bool, float, str, List[str]]:
+    @staticmethod
+    def _locate_in_raw(normalized_text: str, content: str) -> Optional[Tuple[int, int]]:
+        """Locate normalized text in raw content, tolerating whitespace and case differences.
+        
+        Offsets in the normalized content drift from the raw content wherever
+        whitespace was collapsed, so search the raw text directly for the span.
+        """
+        words = normalized_text.split()
+        if not words:
+            return None
+        pattern = r'\s+'.join(re.escape(word) for word in words)
+        # Quotes were straightened by normalize_text; accept either form in the raw text
+        pattern = pattern.replace('"', '["\u201c\u201d]').replace("'", "['\u2018\u2019]")
+        match = re.search(pattern, content, re.IGNORECASE)
+        return match.span() if match else None
+    
+    def find_text_in_content(self, supporting_text: str, content: str, threshold: float = 0.8,
+                             prepared: Optional[PreparedContent] = None) -> tuple[bool, float, str, List[str]]:
         """Find supporting text in publication content and provide suggestions."""
+        if prepared is None:
+            prepared = self.prepare_content(content)
         normalized_supporting = self.normalize_text(supporting_text)
-        normalized_content = self.normalize_text(content)
+        normalized_content = prepared.normalized
         
         # Exact match
-        if normalized_supporting in normalized_content:
-            match_pos = normalized_content.find(normalized_supporting)
-            start = max(0, match_pos - 100)
-            end = min(len(content), match_pos + len(supporting_text) + 100)
+        match_pos = normalized_content.find(normalized_supporting)
+        if match_pos != -1:
+            span = self._locate_in_raw(normalized_supporting, content)
+            if span is None:
+                # Fall back to the normalized offset, which is approximate
+                span = (match_pos, match_pos + len(supporting_text))
+            start = max(0, span[0] - 100)
+            end = min(len(content), span[1] + 100)
             context = content[start:end].strip()
             return True, 1.0, context, []
         
         # Check for high similarity matches in sentences
-        content_sentences = re.split(r'[.!?]+', content)
         best_similarity = 0.0
         best_sentence = ""
         suggestions = []
+        query_tokens = set(normalized_supporting.split())
+        query_size = len(query_tokens)
+        floor = min(0.5, threshold)
         
-        for sentence in content_sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 10:  # Skip very short sentences
+        for sentence, sentence_tokens in zip(prepared.sentences, prepared.sentence_tokens):
+            # Jaccard can't exceed min(|A|, |B|) / max(|A|, |B|); skip sentences
+            # that could neither become a suggestion, a match, nor the new best
+            sentence_size = len(sentence_tokens)
+            if query_size and sentence_size:
+                bound = min(query_size, sentence_size) / max(query_size, sentence_size)
+            else:
+                bound = 0.0
+            if bound < floor and bound <= best_similarity:
                 continue
-                
-            similarity = self.calculate_similarity(normalized_supporting, sentence)
+            
+            # Word-set Jaccard, as in calculate_similarity, on pre-tokenized sets
+            if bound:
+                overlap = len(query_tokens & sentence_tokens)
+                similarity = overlap / (query_size + sentence_size - overlap)
+            else:
+                similarity = 0.0
             if similarity > best_similarity:
                 best_similarity = similarity
                 best_sentence = sentence
             
             # Collect potential suggestions (sentences with decent similarity)
             if similarity >= 0.5:
-                suggestions.append(f"Similarity {similarity:.2f}: {sentence[:100]}...")
+                suggestions.append((similarity, sentence[:100]))
             
             if similarity >= threshold:
-                return True, similarity, sentence, suggestions
+                return True, similarity, sentence, self._format_suggestions(suggestions)
         
         # Limit suggestions to top 3
-        suggestions = sorted(suggestions, key=lambda x: float(x.split()[1][:-1]), reverse=True)[:3]
+        top = heapq.nlargest(3, suggestions, key=lambda item: item[0])
         
-        return False, best_similarity, best_sentence, suggestions
+        return False, best_similarity, best_sentence, self._format_suggestions(top)
+    
+    @staticmethod
+    def _format_suggestions(suggestions: List[Tuple[float, str]]) -> List[str]:
+        """Render (similarity, sentence) pairs for the report."""
+        return [f"Similarity {similarity:.2f}: {sentence}..." for similarity, sentence in suggestions]
     
     async def validate_supporting_text(self, text: str, reference: str) -> ValidationResult:
         """Validate a single supporting text entry."""
@@ -373,11 +717,15 @@ class TextValidator:
                 found=False, error="Could not fetch publication content"
             )
         
-        # Check disease relevance first
-        disease_relevant, disease_relevance_score = self.check_disease_relevance(content)
+        prepared = self._prepare(reference, content)
+        
+        # Check disease relevance first (once per publication)
+        if prepared.relevance is None:
+            prepared.relevance = self.check_disease_relevance(content, prepared)
+        disease_relevant, disease_relevance_score = prepared.relevance
         
         # Check text match
-        found, similarity, context, suggestions = self.find_text_in_content(text, content)
+        found, similarity, context, suggestions = self.find_text_in_content(text, content, prepared=prepared)
         
         return ValidationResult(
             hpo_id="", hpo_name="", text=text, reference=reference,
@@ -390,11 +738,38 @@ class TextValidator:
 def load_annotation_file(filepath: str) -> Dict[str, Any]:
     """Load annotation YAML file."""
     with open(filepath, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAMLLoader)
 
 
-async def validate_annotation_file(filepath: str, similarity_threshold: float = 0.8) -> Tuple[List[ValidationResult], List[IdentifierValidationResult]]:
-    """Validate all supporting text in an annotation file."""
+def collect_pmids(data: Dict[str, Any], sections: Iterable[str] = ANNOTATION_SECTIONS) -> Set[str]:
+    """Collect the unique PMID references cited in the given sections of an annotation file."""
+    pmids = set()
+    for section_name in sections:
+        # Frequency texts are only validated outside diagnostic_methodology
+        keys = ['supporting_text']
+        if section_name != 'diagnostic_methodology':
+            keys.append('frequency_supporting_text')
+        for annotation in data.get(section_name) or []:
+            for key in keys:
+                for support_entry in annotation.get(key) or []:
+                    if not isinstance(support_entry, dict):
+                        continue
+                    # Unfilled entries (e.g. reference: null) are skipped, as in validation
+                    reference = support_entry.get('reference') or ''
+                    if reference.startswith("PMID:") and support_entry.get('text'):
+                        pmids.add(reference)
+    return pmids
+
+
+async def validate_annotation_file(filepath: str, similarity_threshold: float = 0.8,
+                                   fail_fast: bool = False,
+                                   sections: Optional[Iterable[str]] = None) -> Tuple[List[ValidationResult], List[IdentifierValidationResult]]:
+    """Validate all supporting text in an annotation file.
+    
+    If sections is given, only those annotation sections are validated.
+    With fail_fast, pending validations are cancelled as soon as one entry
+    can't be verified, and only the completed results are returned.
+    """
     print(f"Loading annotation file: {filepath}")
     data = load_annotation_file(filepath)
     
@@ -402,95 +777,141 @@ async def validate_annotation_file(filepath: str, similarity_threshold: float =
     disease_id = data.get('disease_id', '')
     print(f"Disease: {disease_name} ({disease_id})")
     
-    fetcher = PMIDFetcher()
-    validator = TextValidator(fetcher, disease_name, disease_id)
-    identifier_validator = IdentifierValidator()
-    results = []
-    identifier_results = []
+    # Sections are always processed in report order, whatever order was requested
+    if sections is None:
+        sections = ANNOTATION_SECTIONS
+    else:
+        requested = set(sections)
+        sections = [name for name in ANNOTATION_SECTIONS if name in requested]
     
-    # Process all annotation sections
-    sections = ['phenotypic_features', 'inheritance', 'clinical_course', 'diagnostic_methodology']
-    
-    for section_name in sections:
-        if section_name not in data:
-            continue
-            
-        print(f"\nValidating {section_name}...")
-        section = data[section_name]
-        
-        for annotation in section:
-            # Handle different annotation types
-            if section_name == 'diagnostic_methodology':
-                # Diagnostic methodology has different fields
-                method_name = annotation.get('method_name', '')
-                method_id = annotation.get('method_id', '')
-                identifier = f"{method_name} ({method_id})" if method_id else method_name
-                print(f"  Checking {identifier}")
-                
-                # Validate method identifier if present
-                if method_id and method_id != 'null':
-                    id_result = await identifier_validator.validate_identifier(method_name, method_id)
-                    identifier_results.append(id_result)
-            else:
-                # Standard HPO-based annotations
-                hpo_id = annotation.get('hpo_id', '')
-                hpo_name = annotation.get('hpo_name', '')
-                if hpo_id and hpo_name:
-                    print(f"  Checking {hpo_id} ({hpo_name})")
-                identifier = f"{hpo_id} ({hpo_name})" if hpo_id and hpo_name else "Unknown"
+    async with _make_client() as client:
+        fetcher = PMIDFetcher()
+        validator = await TextValidator.create(fetcher, disease_name, disease_id, client)
+        identifier_validator = IdentifierValidator(client)
+        
+        # Entries are validated concurrently, capping in-flight fetches; tasks
+        # start as soon as they're scheduled so sections don't wait on each other
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_VALIDATIONS)
+        tasks: List[asyncio.Task] = []  # in file order
+        identifier_tasks: List[asyncio.Task] = []
+        # (text, reference) -> validation, so a quote cited for several terms is checked once
+        unique_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        
+        async def validate_unique(text: str, reference: str) -> ValidationResult:
+            async with semaphore:
+                return await validator.validate_supporting_text(text, reference)
+        
+        async def validate_job(unique_task: asyncio.Task, hpo_id: str, hpo_name: str) -> ValidationResult:
+            # Each occurrence gets its own copy, labelled with its own term
+            result = replace(await unique_task, hpo_id=hpo_id, hpo_name=hpo_name)
+            if fail_fast and not result.found:
+                stop_early()
+            return result
+        
+        def stop_early() -> None:
+            current = asyncio.current_task()
+            for task in [*tasks, *identifier_tasks, *unique_tasks.values()]:
+                if task is not current:
+                    task.cancel()
+        
+        async def validate_identifier_job(method_name: str, method_id: str) -> IdentifierValidationResult:
+            async with semaphore:
+                return await identifier_validator.validate_identifier(method_name, method_id)
+        
+        # Fetch every referenced paper up front, one concurrent batch (unless
+        # failing fast, where papers are better fetched only as they're needed)
+        pmids = collect_pmids(data, sections)
+        if pmids and not fail_fast:
+            print(f"Fetching {len(pmids)} referenced papers...")
+            await fetcher.prefetch(sorted(pmids))
+        
+        async with asyncio.TaskGroup() as task_group:
+            def schedule(text: str, reference: str, hpo_id: str, hpo_name: str) -> None:
+                key = (text, reference)
+                if key not in unique_tasks:
+                    unique_tasks[key] = task_group.create_task(validate_unique(text, reference))
+                tasks.append(task_group.create_task(validate_job(unique_tasks[key], hpo_id, hpo_name)))
             
-            # Validate main supporting text
-            supporting_texts = annotation.get('supporting_text', [])
-            for support_entry in supporting_texts:
-                text = support_entry.get('text', '')
-                reference = support_entry.get('reference', '')
+            for section_name in sections:
+                if section_name not in data:
+                    continue
+                    
+                print(f"\nValidating {section_name}...")
+                section = data[section_name]
                 
-                if text and reference:
-                    result = await validator.validate_supporting_text(text, reference)
+                for annotation in section:
+                    # Handle different annotation types
                     if section_name == 'diagnostic_methodology':
-                        result.hpo_id = method_name
-                        result.hpo_name = annotation.get('method_type', '')
+                        # Diagnostic methodology has different fields
+                        method_name = annotation.get('method_name', '')
+                        method_id = annotation.get('method_id', '')
+                        identifier = f"{method_name} ({method_id})" if method_id else method_name
+                        print(f"  Checking {identifier}")
+                        
+                        # Validate method identifier if present
+                        if method_id and method_id != 'null':
+                            identifier_tasks.append(task_group.create_task(validate_identifier_job(method_name, method_id)))
                     else:
-                        result.hpo_id = annotation.get('hpo_id', '')
-                        result.hpo_name = annotation.get('hpo_name', '')
-                    results.append(result)
-            
-            # Validate frequency supporting text (only for non-diagnostic methodology sections)
-            if section_name != 'diagnostic_methodology':
-                freq_texts = annotation.get('frequency_supporting_text', [])
-                for support_entry in freq_texts:
-                    text = support_entry.get('text', '')
-                    reference = support_entry.get('reference', '')
+                        # Standard HPO-based annotations
+                        hpo_id = annotation.get('hpo_id', '')
+                        hpo_name = annotation.get('hpo_name', '')
+                        if hpo_id and hpo_name:
+                            print(f"  Checking {hpo_id} ({hpo_name})")
+                        identifier = f"{hpo_id} ({hpo_name})" if hpo_id and hpo_name else "Unknown"
                     
-                    if text and reference:
-                        result = await validator.validate_supporting_text(text, reference)
-                        result.hpo_id = annotation.get('hpo_id', '')
-                        result.hpo_name = annotation.get('hpo_name', '')
-                        results.append(result)
+                    # Schedule main supporting text
+                    supporting_texts = annotation.get('supporting_text', [])
+                    for support_entry in supporting_texts:
+                        text = support_entry.get('text', '')
+                        reference = support_entry.get('reference', '')
+                        
+                        if text and reference:
+                            if section_name == 'diagnostic_methodology':
+                                schedule(text, reference, method_name, annotation.get('method_type', ''))
+                            else:
+                                schedule(text, reference, annotation.get('hpo_id', ''), annotation.get('hpo_name', ''))
+                    
+                    # Schedule frequency supporting text (only for non-diagnostic methodology sections)
+                    if section_name != 'diagnostic_methodology':
+                        freq_texts = annotation.get('frequency_supporting_text', [])
+                        for support_entry in freq_texts:
+                            text = support_entry.get('text', '')
+                            reference = support_entry.get('reference', '')
+                            
+                            if text and reference:
+                                schedule(text, reference, annotation.get('hpo_id', ''), annotation.get('hpo_name', ''))
+        
+        results = [task.result() for task in tasks if not task.cancelled()]
+        identifier_results = [task.result() for task in identifier_tasks if not task.cancelled()]
     
     return results, identifier_results
 
 
-def print_validation_report(results: List[ValidationResult], identifier_results: List[IdentifierValidationResult] = None):
-    """Print a validation report with actionable suggestions."""
+def print_validation_report(results: List[ValidationResult], identifier_results: List[IdentifierValidationResult] = None,
+                            file=None):
+    """Print a validation report with actionable suggestions.
+    
+    The report is assembled in memory and written in a single call.
+    """
+    out: List[str] = []
     total = len(results)
     found = sum(1 for r in results if r.found)
     disease_relevant = sum(1 for r in results if r.disease_relevant)
     disease_irrelevant = sum(1 for r in results if r.disease_relevant is False)
     
-    print(f"\n{'='*80}")
-    print(f"ANNOTATION VALIDATION REPORT")
-    print(f"{'='*80}")
-    print(f"Total supporting text entries: {total}")
-    print(f"✓ Found in publications: {found}")
-    print(f"✗ Not found: {total - found}")
-    print(f"🎯 Disease-relevant publications: {disease_relevant}")
-    print(f"❌ Disease-irrelevant publications: {disease_irrelevant}")
-    print(f"Success rate: {found/total*100:.1f}%" if total > 0 else "No entries to validate")
-    print(f"Relevance rate: {disease_relevant/total*100:.1f}%" if total > 0 else "No entries to check")
+    out.append(f"\n{'='*80}")
+    out.append(f"ANNOTATION VALIDATION REPORT")
+    out.append(f"{'='*80}")
+    out.append(f"Total supporting text entries: {total}")
+    out.append(f"✓ Found in publications: {found}")
+    out.append(f"✗ Not found: {total - found}")
+    out.append(f"🎯 Disease-relevant publications: {disease_relevant}")
+    out.append(f"❌ Disease-irrelevant publications: {disease_irrelevant}")
+    out.append(f"Success rate: {found/total*100:.1f}%" if total > 0 else "No entries to validate")
+    out.append(f"Relevance rate: {disease_relevant/total*100:.1f}%" if total > 0 else "No entries to check")
     
-    print(f"\n{'DETAILED RESULTS'}")
-    print(f"{'-'*80}")
+    out.append(f"\n{'DETAILED RESULTS'}")
+    out.append(f"{'-'*80}")
     
     for i, result in enumerate(results, 1):
         status = "✓ FOUND" if result.found else "✗ NOT FOUND"
@@ -506,57 +927,57 @@ def print_validation_report(results: List[ValidationResult], identifier_results:
         else:
             relevance_text = ""
         
-        print(f"\n{i}. {status} {conf_icon}{similarity}{relevance_text}")
+        out.append(f"\n{i}. {status} {conf_icon}{similarity}{relevance_text}")
         
         if result.hpo_id:
-            print(f"   HPO: {result.hpo_id} ({result.hpo_name})")
-        print(f"   Reference: {result.reference}")
-        print(f"   Text: {result.text}")
+            out.append(f"   HPO: {result.hpo_id} ({result.hpo_name})")
+        out.append(f"   Reference: {result.reference}")
+        out.append(f"   Text: {result.text}")
         
         if result.error:
-            print(f"   ❌ Error: {result.error}")
+            out.append(f"   ❌ Error: {result.error}")
         
         if result.context:
-            print(f"   📍 Context: {result.context[:200]}{'...' if len(result.context) > 200 else ''}")
+            out.append(f"   📍 Context: {result.context[:200]}{'...' if len(result.context) > 200 else ''}")
         
         if result.suggestions:
-            print(f"   💡 Suggestions for improvement:")
+            out.append(f"   💡 Suggestions for improvement:")
             for suggestion in result.suggestions:
-                print(f"      • {suggestion}")
+                out.append(f"      • {suggestion}")
     
     # Summary of failed validations
     failed_results = [r for r in results if not r.found]
     if failed_results:
-        print(f"\n{'='*80}")
-        print(f"FAILED VALIDATIONS SUMMARY")
-        print(f"{'='*80}")
-        print(f"The following {len(failed_results)} supporting text entries need attention:")
+        out.append(f"\n{'='*80}")
+        out.append(f"FAILED VALIDATIONS SUMMARY")
+        out.append(f"{'='*80}")
+        out.append(f"The following {len(failed_results)} supporting text entries need attention:")
         
         for i, result in enumerate(failed_results, 1):
-            print(f"\n{i}. {result.hpo_id} ({result.hpo_name})")
-            print(f"   Reference: {result.reference}")
-            print(f"   Text: {result.text[:80]}{'...' if len(result.text) > 80 else ''}")
+            out.append(f"\n{i}. {result.hpo_id} ({result.hpo_name})")
+            out.append(f"   Reference: {result.reference}")
+            out.append(f"   Text: {result.text[:80]}{'...' if len(result.text) > 80 else ''}")
             if result.error:
-                print(f"   Issue: {result.error}")
+                out.append(f"   Issue: {result.error}")
             elif result.suggestions:
-                print(f"   Best alternative: {result.suggestions[0] if result.suggestions else 'No suggestions'}")
-            print(f"   Action needed: {'Check PMID validity' if result.error else 'Update supporting text or find better quote'}")
+                out.append(f"   Best alternative: {result.suggestions[0] if result.suggestions else 'No suggestions'}")
+            out.append(f"   Action needed: {'Check PMID validity' if result.error else 'Update supporting text or find better quote'}")
     
     # Print identifier validation results if present
     if identifier_results:
-        print(f"\n{'='*80}")
-        print(f"IDENTIFIER VALIDATION REPORT")
-        print(f"{'='*80}")
+        out.append(f"\n{'='*80}")
+        out.append(f"IDENTIFIER VALIDATION REPORT")
+        out.append(f"{'='*80}")
         
         valid_ids = sum(1 for r in identifier_results if r.valid)
         title_matches = sum(1 for r in identifier_results if r.title_match)
         total_ids = len(identifier_results)
         
-        print(f"Total identifiers checked: {total_ids}")
-        print(f"✓ Valid identifiers: {valid_ids}")
-        print(f"✗ Invalid identifiers: {total_ids - valid_ids}")
+        out.append(f"Total identifiers checked: {total_ids}")
+        out.append(f"✓ Valid identifiers: {valid_ids}")
+        out.append(f"✗ Invalid identifiers: {total_ids - valid_ids}")
         if title_matches > 0:
-            print(f"📋 Title matches: {title_matches}")
+            out.append(f"📋 Title matches: {title_matches}")
         
         for i, result in enumerate(identifier_results, 1):
             status = "✓ VALID" if result.valid else "✗ INVALID"
@@ -564,38 +985,40 @@ def print_validation_report(results: List[ValidationResult], identifier_results:
             if result.title_match is not None:
                 match_status = " 📋 TITLE MATCH" if result.title_match else " ❌ TITLE MISMATCH"
             
-            print(f"\n{i}. {status}{match_status}")
-            print(f"   Method: {result.method_name}")
-            print(f"   ID: {result.method_id}")
+            out.append(f"\n{i}. {status}{match_status}")
+            out.append(f"   Method: {result.method_name}")
+            out.append(f"   ID: {result.method_id}")
             
             if result.retrieved_title:
-                print(f"   Retrieved Title: {result.retrieved_title[:100]}{'...' if len(result.retrieved_title) > 100 else ''}")
+                out.append(f"   Retrieved Title: {result.retrieved_title[:100]}{'...' if len(result.retrieved_title) > 100 else ''}")
             
             if result.error:
-                print(f"   ❌ Error: {result.error}")
+                out.append(f"   ❌ Error: {result.error}")
 
-    print(f"\n{'='*80}")
-    print(f"NEXT STEPS")
-    print(f"{'='*80}")
+    out.append(f"\n{'='*80}")
+    out.append(f"NEXT STEPS")
+    out.append(f"{'='*80}")
     
     if failed_results:
-        print("1. For failed validations:")
-        print("   - Verify PMID references are correct")
-        print("   - Update supporting text to match exact quotes from papers")
-        print("   - Consider using suggested alternatives if available")
-        print("   - Remove entries that cannot be validated")
+        out.append("1. For failed validations:")
+        out.append("   - Verify PMID references are correct")
+        out.append("   - Update supporting text to match exact quotes from papers")
+        out.append("   - Consider using suggested alternatives if available")
+        out.append("   - Remove entries that cannot be validated")
         
     if disease_irrelevant > 0:
-        print("2. For disease-irrelevant papers:")
-        print("   - Check if PMIDs are correct for the disease being annotated")
-        print("   - Consider finding more specific publications")
+        out.append("2. For disease-irrelevant papers:")
+        out.append("   - Check if PMIDs are correct for the disease being annotated")
+        out.append("   - Consider finding more specific publications")
         
     if found == total:
-        print("🎉 All supporting text entries validated successfully!")
-        print("   - Consider adding more phenotypic features if needed")
-        print("   - Review frequency data and inheritance patterns")
+        out.append("🎉 All supporting text entries validated successfully!")
+        out.append("   - Consider adding more phenotypic features if needed")
+        out.append("   - Review frequency data and inheritance patterns")
+    
+    out.append(f"\n{'='*80}")
     
-    print(f"\n{'='*80}")
+    (file or sys.stdout).write("\n".join(out) + "\n")
 
 
 async def main():
@@ -605,11 +1028,25 @@ async def main():
                        help="Similarity threshold for text matching (default: 0.8)")
     parser.add_argument("--verbose", action="store_true", 
                        help="Print verbose output")
+    parser.add_argument("--fail-fast", action="store_true",
+                       help="Stop at the first supporting text entry that can't be verified")
+    parser.add_argument("--sections",
+                       help=f"Comma-separated sections to validate (default: all of {', '.join(ANNOTATION_SECTIONS)})")
     
     args = parser.parse_args()
     
+    sections = None
+    if args.sections is not None:
+        sections = [name.strip() for name in args.sections.split(',') if name.strip()]
+        if not sections:
+            parser.error("no sections given")
+        unknown = [name for name in sections if name not in ANNOTATION_SECTIONS]
+        if unknown:
+            parser.error(f"unknown section(s): {', '.join(unknown)}")
+    
     try:
-        results, identifier_results = await validate_annotation_file(args.annotation_file, args.threshold)
+        results, identifier_results = await validate_annotation_file(args.annotation_file, args.threshold,
+                                                                     fail_fast=args.fail_fast, sections=sections)
         print_validation_report(results, identifier_results)
         
         # Exit with error code if validation failed
@@ -627,4 +1064,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
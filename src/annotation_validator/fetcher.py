@@ -3,59 +3,244 @@ Publication fetching utilities.
 """
 
 import asyncio
+import gzip
+import httpx
 import json
 import logging
 import os
-import requests
+import random
+import re
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import orjson  # optional: faster cache encoding/decoding
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+# NCBI asks E-utilities clients to identify themselves with a tool name
+EFETCH_PARAMS = {"db": "pubmed", "retmode": "text", "rettype": "abstract", "tool": "annotation-validator"}
+
+# Multi-PMID EFetch text output: records separated by two blank lines, each
+# starting with its position ("2. ") and carrying a "PMID: <id>" line
+_RECORD_SPLIT_RE = re.compile(r'\n{3,}(?=\d+\. )')
+_RECORD_PMID_RE = re.compile(r'^PMID:\s*(\d+)', re.MULTILINE)
+_RECORD_NUMBER_RE = re.compile(r'^\d+\. ')
+
+# Transient EFetch failures are retried with exponential backoff and jitter
+MAX_RETRIES = 4
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_BACKOFF = 60.0
+# PMIDs that NCBI returned no record for are not re-requested for this long (seconds)
+NOT_FOUND_TTL = 3600
+NOT_FOUND_ERROR = "notfound"
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Encode a cache entry as compact JSON."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Decode a cache entry (compact or pretty-printed JSON)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class PMIDFetcher:
     """Fetch publication content from PubMed."""
     
-    def __init__(self, delay: float = 0.5, cache_dir: str = "publication-cache"):
+    def __init__(self, delay: float = 0.5, cache_dir: str = "publication-cache",
+                 client: Optional[httpx.AsyncClient] = None, max_concurrent: int = 3):
+        # Requests to NCBI start at least `delay` seconds apart, with at most
+        # `max_concurrent` in flight (NCBI allows 3/s without an API key)
         self.delay = delay
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._next_request_at = 0.0
         self.cache = {}
+        self._not_found: Dict[str, float] = {}  # PMID -> wall-clock expiry of its negative entry
+        # Fetches in progress, so concurrent callers for one PMID share a single request
+        self._inflight: Dict[str, asyncio.Task] = {}
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        # Created on first use and kept open so NCBI connections are reused
+        self._client = client
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": "annotation-validator"},
+                timeout=30,
+                limits=httpx.Limits(max_connections=3, keepalive_expiry=60),
+            )
+        return self._client
+    
+    async def _wait_for_slot(self) -> None:
+        """Sleep until this caller's reserved request start time."""
+        now = asyncio.get_running_loop().time()
+        # Reserve the slot before sleeping so concurrent callers queue up behind it
+        start_at = max(now, self._next_request_at)
+        self._next_request_at = start_at + self.delay
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+    
+    async def close(self) -> None:
+        """Close the HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     def _get_cache_file(self, pmid: str) -> Path:
-        """Get cache file path for a PMID."""
+        """Get cache file path for a PMID.
+        
+        Files are sharded into subdirectories by the PMID's last two digits so
+        no single directory grows unboundedly.
+        """
         clean_pmid = pmid.replace("PMID:", "")
-        return self.cache_dir / f"PMID_{clean_pmid}_abstract.json"
+        return self.cache_dir / clean_pmid[-2:] / f"PMID_{clean_pmid}_abstract.json.gz"
     
-    def _load_from_cache(self, pmid: str) -> Optional[Dict[str, str]]:
+    def _get_legacy_cache_files(self, pmid: str) -> List[Path]:
+        """Get cache file paths written by earlier versions (uncompressed, sharded or flat)."""
+        clean_pmid = pmid.replace("PMID:", "")
+        name = f"PMID_{clean_pmid}_abstract.json"
+        return [self.cache_dir / clean_pmid[-2:] / name, self.cache_dir / name]
+    
+    def _load_from_cache(self, pmid: str) -> Optional[Dict[str, Any]]:
         """Load publication data from cache file."""
-        cache_file = self._get_cache_file(pmid)
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.warning(f"Could not load cache for {pmid}: {e}")
+        for cache_file in [self._get_cache_file(pmid), *self._get_legacy_cache_files(pmid)]:
+            if cache_file.exists():
+                try:
+                    raw = cache_file.read_bytes()
+                    if cache_file.suffix == ".gz":
+                        raw = gzip.decompress(raw)
+                    return _loads(raw)
+                except Exception as e:
+                    logger.warning(f"Could not load cache for {pmid}: {e}")
         return None
     
-    def _save_to_cache(self, pmid: str, data: Dict[str, str]) -> None:
+    def _save_to_cache(self, pmid: str, data: Dict[str, Any]) -> None:
         """Save publication data to cache file."""
         cache_file = self._get_cache_file(pmid)
+        # Write to a temporary file and rename it into place, so an interrupted
+        # write never leaves a truncated entry behind
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            cache_file.parent.mkdir(exist_ok=True)
+            tmp_file.write_bytes(gzip.compress(_dumps(data), compresslevel=6))
+            os.replace(tmp_file, cache_file)
         except Exception as e:
             logger.warning(f"Could not save cache for {pmid}: {e}")
+            tmp_file.unlink(missing_ok=True)
 
-    async def fetch_abstract(self, pmid: str) -> Optional[Dict[str, str]]:
+    def _is_not_found(self, pmid: str, cached_data: Optional[Dict[str, Any]] = None) -> bool:
+        """Whether NCBI recently returned no record for a PMID.
+        
+        A negative entry loaded from the disk cache is remembered in memory.
+        """
+        if cached_data is not None and cached_data.get("error") == NOT_FOUND_ERROR:
+            self._not_found[pmid] = float(cached_data.get("fetched_at", 0)) + NOT_FOUND_TTL
+        return self._not_found.get(pmid, 0.0) > time.time()
+    
+    async def _store_not_found(self, pmid: str) -> None:
+        """Record that NCBI has no record for a PMID, in memory and on disk."""
+        now = time.time()
+        self._not_found[pmid] = now + NOT_FOUND_TTL
+        entry = {"error": NOT_FOUND_ERROR, "pmid": pmid, "fetched_at": now}
+        await asyncio.to_thread(self._save_to_cache, pmid, entry)
+    
+    def _parse_record(self, pmid: str, content: str) -> Optional[Dict[str, Any]]:
+        """Parse one EFetch text record into title, abstract and full text."""
+        if not content or content.startswith("ERROR"):
+            return None
+        
+        # Parse title and abstract from the response
+        title = ""
+        abstract_lines = []
+        
+        for line in content.split('\n'):
+            stripped = line.strip()
+            if stripped and not line.startswith("1.") and not line.startswith("PMID:"):
+                if not title and "." in line and len(line) > 20:
+                    title = stripped
+                elif len(line) > 30:
+                    abstract_lines.append(stripped)
+        
+        return {
+            "title": title,
+            "abstract": " ".join(abstract_lines),
+            "full_text": content,
+            "pmid": pmid,
+            "fetched_at": time.time()
+        }
+    
+    async def _store(self, pmid: str, result: Dict[str, Any]) -> None:
+        """Cache a parsed record both in memory and on disk."""
+        self.cache[pmid] = result
+        # File I/O runs in a worker thread so a slow disk doesn't stall the event loop
+        await asyncio.to_thread(self._save_to_cache, pmid, result)
+    
+    async def _efetch(self, clean_pmids: List[str]) -> str:
+        """Run one rate-limited EFetch request for the given bare PMIDs.
+        
+        Transient failures (429/5xx, connection errors) are retried up to
+        MAX_RETRIES times, honoring Retry-After when NCBI sends one.
+        """
+        data = {**EFETCH_PARAMS, "id": ",".join(clean_pmids)}
+        for attempt in range(MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    await self._wait_for_slot()
+                    # POST so long ID lists aren't limited by URL length
+                    response = await self._get_client().post(EFETCH_URL, data=data)
+            except httpx.TransportError:
+                if attempt == MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    return response.text
+                retry_after = response.headers.get("Retry-After")
+            # Back off outside the semaphore so other requests can proceed meanwhile
+            delay = min(MAX_BACKOFF, 2 ** attempt + random.random())
+            if retry_after and retry_after.isdigit():
+                delay = min(MAX_BACKOFF, float(retry_after))
+            logger.warning(f"EFetch attempt {attempt + 1} failed, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    async def fetch_abstract(self, pmid: str) -> Optional[Dict[str, Any]]:
         """Fetch abstract and title for a PMID."""
         # Check memory cache first
         if pmid in self.cache:
             return self.cache[pmid]
         
+        if self._is_not_found(pmid):
+            return None
+        
+        # Join a fetch already in progress for this PMID instead of starting another
+        task = self._inflight.get(pmid)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_uncached(pmid))
+            self._inflight[pmid] = task
+            task.add_done_callback(lambda _: self._inflight.pop(pmid, None))
+        # Shielded so one caller being cancelled doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fetch_uncached(self, pmid: str) -> Optional[Dict[str, Any]]:
+        """Fetch a PMID missing from the memory cache, from disk or NCBI."""
         # Check file cache
-        cached_data = self._load_from_cache(pmid)
-        if cached_data:
+        cached_data = await asyncio.to_thread(self._load_from_cache, pmid)
+        if self._is_not_found(pmid, cached_data):
+            return None
+        if cached_data and "error" not in cached_data:
             self.cache[pmid] = cached_data
             return cached_data
         
@@ -64,49 +249,72 @@ class PMIDFetcher:
         
         try:
             # Use E-utilities to fetch abstract
-            base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-            params = {
-                "db": "pubmed",
-                "id": clean_pmid,
-                "retmode": "text",
-                "rettype": "abstract"
-            }
-            
-            response = requests.get(base_url, params=params)
-            response.raise_for_status()
-            
-            content = response.text.strip()
-            if content and not content.startswith("ERROR"):
-                # Parse title and abstract from the response
-                lines = content.split('\n')
-                title = ""
-                abstract = ""
-                
-                for i, line in enumerate(lines):
-                    if line.strip() and not line.startswith("1.") and not line.startswith("PMID:"):
-                        if not title and "." in line and len(line) > 20:
-                            title = line.strip()
-                        elif line.strip() and len(line) > 30:
-                            abstract += line.strip() + " "
-                
-                result = {
-                    "title": title.strip(),
-                    "abstract": abstract.strip(),
-                    "full_text": content,
-                    "pmid": pmid,
-                    "fetched_at": str(asyncio.get_event_loop().time())
-                }
-                
-                # Cache both in memory and file
-                self.cache[pmid] = result
-                self._save_to_cache(pmid, result)
-                
-                await asyncio.sleep(self.delay)  # Be nice to NCBI
+            content = (await self._efetch([clean_pmid])).strip()
+            result = self._parse_record(pmid, content)
+            if result is not None:
+                await self._store(pmid, result)
                 return result
             else:
                 logger.warning(f"Could not fetch abstract for {pmid}")
+                await self._store_not_found(pmid)
                 return None
                 
         except Exception as e:
             logger.error(f"Error fetching {pmid}: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    async def fetch_abstracts_bulk(self, pmids: Iterable[str], batch_size: int = 200) -> Dict[str, Dict[str, Any]]:
+        """Fetch many PMIDs with one EFetch request per batch, warming the caches.
+        
+        Returns the records that could be fetched (or were already cached),
+        keyed by the PMIDs as given.
+        """
+        results = {}
+        missing = {}  # bare PMID -> PMID as given
+        in_flight = []  # already being fetched by another caller
+        unique_pmids = list(dict.fromkeys(pmids))
+        # Read the disk cache for everything not in memory concurrently, off the event loop
+        to_load = [pmid for pmid in unique_pmids if pmid not in self.cache and not self._is_not_found(pmid)]
+        loaded = dict(zip(to_load, await asyncio.gather(
+            *(asyncio.to_thread(self._load_from_cache, pmid) for pmid in to_load)
+        )))
+        for pmid in unique_pmids:
+            cached_data = self.cache.get(pmid) or loaded.get(pmid)
+            if self._is_not_found(pmid, cached_data):
+                continue
+            if cached_data and "error" not in cached_data:
+                self.cache[pmid] = cached_data
+                results[pmid] = cached_data
+            elif pmid in self._inflight:
+                in_flight.append(pmid)
+            else:
+                missing[pmid.replace("PMID:", "")] = pmid
+        
+        clean_pmids = list(missing)
+        for start in range(0, len(clean_pmids), batch_size):
+            batch = clean_pmids[start:start + batch_size]
+            try:
+                content = await self._efetch(batch)
+            except Exception as e:
+                logger.error(f"Error fetching batch of {len(batch)} PMIDs: {e}")
+                continue
+            
+            # Records are numbered "1. ", "2. ", ...; match them up by their PMID line
+            for record in _RECORD_SPLIT_RE.split(content.strip()):
+                record_pmids = _RECORD_PMID_RE.findall(record)
+                pmid = missing.get(record_pmids[0]) if len(record_pmids) == 1 else None
+                if pmid is None:
+                    continue
+                # Number the record as a single-PMID fetch would, so cached text is identical
+                result = self._parse_record(pmid, _RECORD_NUMBER_RE.sub("1. ", record.strip(), count=1))
+                if result is not None:
+                    await self._store(pmid, result)
+                    results[pmid] = result
+        
+        # Anything the batch didn't yield is retried on its own; in-flight fetches are joined
+        for pmid in [*missing.values(), *in_flight]:
+            if pmid not in results:
+                result = await self.fetch_abstract(pmid)
+                if result is not None:
+                    results[pmid] = result
+        return results
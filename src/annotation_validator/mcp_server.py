@@ -19,98 +19,144 @@ from mcp.types import (
     TextContent,
 )
 
-from .validator import AnnotationValidator
+from .validator import AnnotationValidator, ValidationResult
 
-# Global validator instance
-validator = AnnotationValidator()
+# Global validator instance, created on first tool call so importing the
+# server (or listing its tools) doesn't set up the fetcher and its cache
+_validator: Optional[AnnotationValidator] = None
+
+def get_validator() -> AnnotationValidator:
+    """Return the shared validator, creating it on first use."""
+    global _validator
+    if _validator is None:
+        _validator = AnnotationValidator()
+    return _validator
+
+# Response templates, built once
+SUPPORTING_TEXT_TEMPLATE = """Validation Result: {status} | {relevance}
+
+Supporting Text: {supporting_text}
+Reference: {pmid}
+Similarity Score: {similarity_score:.2f}
+Disease Relevance Score: {disease_relevance_score:.2f}
+
+Publication Title: {title}
+
+Publication Abstract: {abstract}
+
+{error}"""
+
+HPO_ANNOTATION_TEMPLATE = """HPO Annotation Validation: {hpo_id} ({hpo_name})
+
+Summary:
+- Total supporting texts: {total}
+- Found in publications: {found} ({found_pct:.1f}%)
+- Disease-relevant publications: {relevant} ({relevant_pct:.1f}%)
+
+Details:
+"""
+
+PUBLICATION_INFO_TEMPLATE = """Publication Information: {pmid}
+
+Title: {title}
+
+Abstract: {abstract}"""
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text to width characters, marking the cut with '...'."""
+    return text[:width] + "..." if len(text) > width else text
 
 # Create the MCP server
 server = Server("annotation-validator")
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available validation tools."""
-    return [
-        Tool(
-            name="validate_supporting_text",
-            description="Validate that supporting text appears in the referenced publication",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "supporting_text": {
-                        "type": "string",
-                        "description": "The supporting text to validate"
-                    },
-                    "pmid": {
-                        "type": "string", 
-                        "description": "PMID reference (e.g., 'PMID:12345678')"
-                    },
-                    "disease_keywords": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Keywords to check disease relevance (optional)",
-                        "default": []
-                    }
+# The tool schemas are static, so they are built once at import
+TOOLS = [
+    Tool(
+        name="validate_supporting_text",
+        description="Validate that supporting text appears in the referenced publication",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "supporting_text": {
+                    "type": "string",
+                    "description": "The supporting text to validate"
                 },
-                "required": ["supporting_text", "pmid"]
-            }
-        ),
-        Tool(
-            name="validate_hpo_annotation",
-            description="Validate a complete HPO annotation with multiple supporting texts",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "hpo_id": {
-                        "type": "string",
-                        "description": "HPO term ID (e.g., 'HP:0002321')"
-                    },
-                    "hpo_name": {
-                        "type": "string",
-                        "description": "HPO term name"
-                    },
-                    "supporting_texts": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "text": {"type": "string"},
-                                "reference": {"type": "string"},
-                                "page_section": {"type": "string"}
-                            },
-                            "required": ["text", "reference"]
+                "pmid": {
+                    "type": "string", 
+                    "description": "PMID reference (e.g., 'PMID:12345678')"
+                },
+                "disease_keywords": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Keywords to check disease relevance (optional)",
+                    "default": []
+                }
+            },
+            "required": ["supporting_text", "pmid"]
+        }
+    ),
+    Tool(
+        name="validate_hpo_annotation",
+        description="Validate a complete HPO annotation with multiple supporting texts",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "hpo_id": {
+                    "type": "string",
+                    "description": "HPO term ID (e.g., 'HP:0002321')"
+                },
+                "hpo_name": {
+                    "type": "string",
+                    "description": "HPO term name"
+                },
+                "supporting_texts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "text": {"type": "string"},
+                            "reference": {"type": "string"},
+                            "page_section": {"type": "string"}
                         },
-                        "description": "List of supporting text entries"
+                        "required": ["text", "reference"]
                     },
-                    "disease_keywords": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Keywords to check disease relevance",
-                        "default": []
-                    }
-                },
-                "required": ["hpo_id", "hpo_name", "supporting_texts"]
-            }
-        ),
-        Tool(
-            name="fetch_publication_info",
-            description="Fetch title and abstract for a PMID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pmid": {
-                        "type": "string",
-                        "description": "PMID reference (e.g., 'PMID:12345678')"
-                    }
+                    "description": "List of supporting text entries"
                 },
-                "required": ["pmid"]
-            }
-        )
-    ]
+                "disease_keywords": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Keywords to check disease relevance",
+                    "default": []
+                }
+            },
+            "required": ["hpo_id", "hpo_name", "supporting_texts"]
+        }
+    ),
+    Tool(
+        name="fetch_publication_info",
+        description="Fetch title and abstract for a PMID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pmid": {
+                    "type": "string",
+                    "description": "PMID reference (e.g., 'PMID:12345678')"
+                }
+            },
+            "required": ["pmid"]
+        }
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available validation tools."""
+    return list(TOOLS)
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls."""
+    validator = get_validator()
     
     if name == "validate_supporting_text":
         supporting_text = arguments["supporting_text"]
@@ -123,18 +169,17 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         status = "✓ FOUND" if result.found else "✗ NOT FOUND"
         relevance = "🎯 RELEVANT" if result.disease_relevant else "❌ IRRELEVANT"
         
-        response = f"""Validation Result: {status} | {relevance}
-
-Supporting Text: {supporting_text[:100]}{'...' if len(supporting_text) > 100 else ''}
-Reference: {pmid}
-Similarity Score: {result.similarity_score:.2f}
-Disease Relevance Score: {result.disease_relevance_score:.2f}
-
-Publication Title: {result.publication_title or 'Not available'}
-
-Publication Abstract: {result.publication_abstract[:300] if result.publication_abstract else 'Not available'}{'...' if result.publication_abstract and len(result.publication_abstract) > 300 else ''}
-
-{f'Error: {result.error}' if result.error else ''}"""
+        response = SUPPORTING_TEXT_TEMPLATE.format(
+            status=status,
+            relevance=relevance,
+            supporting_text=_truncate(supporting_text, 100),
+            pmid=pmid,
+            similarity_score=result.similarity_score,
+            disease_relevance_score=result.disease_relevance_score,
+            title=result.publication_title or 'Not available',
+            abstract=_truncate(result.publication_abstract, 300) if result.publication_abstract else 'Not available',
+            error=f'Error: {result.error}' if result.error else '',
+        )
         
         return [TextContent(type="text", text=response)]
     
@@ -144,15 +189,24 @@ Publication Abstract: {result.publication_abstract[:300] if result.publication_a
         supporting_texts = arguments["supporting_texts"]
         disease_keywords = arguments.get("disease_keywords", [])
         
+        # Fetch all referenced abstracts in batched requests before validating
+        await validator.fetcher.fetch_abstracts_bulk(
+            entry["reference"] for entry in supporting_texts if entry["reference"].startswith("PMID:")
+        )
+        
+        # Validate all entries concurrently; one failing entry doesn't sink the rest
+        raw_results = await asyncio.gather(
+            *(validator.validate_annotation(entry["text"], entry["reference"], disease_keywords)
+              for entry in supporting_texts),
+            return_exceptions=True,
+        )
+        
         results = []
-        for entry in supporting_texts:
-            result = await validator.validate_annotation(
-                entry["text"], 
-                entry["reference"], 
-                disease_keywords
-            )
+        for entry, result in zip(supporting_texts, raw_results):
+            if isinstance(result, Exception):
+                result = ValidationResult(found=False, error=f"Validation failed: {result}")
             results.append({
-                "text": entry["text"][:50] + "..." if len(entry["text"]) > 50 else entry["text"],
+                "text": _truncate(entry["text"], 50),
                 "reference": entry["reference"],
                 "found": result.found,
                 "similarity": result.similarity_score,
@@ -164,27 +218,28 @@ Publication Abstract: {result.publication_abstract[:300] if result.publication_a
         found = sum(1 for r in results if r["found"])
         relevant = sum(1 for r in results if r["disease_relevant"])
         
-        response = f"""HPO Annotation Validation: {hpo_id} ({hpo_name})
-
-Summary:
-- Total supporting texts: {total}
-- Found in publications: {found} ({found/total*100:.1f}%)
-- Disease-relevant publications: {relevant} ({relevant/total*100:.1f}%)
-
-Details:
-"""
+        # Collect the pieces and join once rather than growing one string
+        parts = [HPO_ANNOTATION_TEMPLATE.format(
+            hpo_id=hpo_id,
+            hpo_name=hpo_name,
+            total=total,
+            found=found,
+            found_pct=found / total * 100,
+            relevant=relevant,
+            relevant_pct=relevant / total * 100,
+        )]
         
         for i, result in enumerate(results, 1):
             status = "✓" if result["found"] else "✗"
             relevance = "🎯" if result["disease_relevant"] else "❌"
-            response += f"\n{i}. {status} {relevance} {result['reference']}"
-            response += f"\n   Text: {result['text']}"
-            response += f"\n   Similarity: {result['similarity']:.2f}"
+            parts.append(f"\n{i}. {status} {relevance} {result['reference']}")
+            parts.append(f"\n   Text: {result['text']}")
+            parts.append(f"\n   Similarity: {result['similarity']:.2f}")
             if result["error"]:
-                response += f"\n   Error: {result['error']}"
-            response += "\n"
+                parts.append(f"\n   Error: {result['error']}")
+            parts.append("\n")
         
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="".join(parts))]
     
     elif name == "fetch_publication_info":
         pmid = arguments["pmid"]
@@ -193,11 +248,11 @@ Details:
         if pub_data is None:
             return [TextContent(type="text", text=f"Could not fetch publication data for {pmid}")]
         
-        response = f"""Publication Information: {pmid}
-
-Title: {pub_data.get('title', 'Not available')}
-
-Abstract: {pub_data.get('abstract', 'Not available')}"""
+        response = PUBLICATION_INFO_TEMPLATE.format(
+            pmid=pmid,
+            title=pub_data.get('title', 'Not available'),
+            abstract=pub_data.get('abstract', 'Not available'),
+        )
         
         return [TextContent(type="text", text=response)]
     
@@ -206,19 +261,23 @@ Abstract: {pub_data.get('abstract', 'Not available')}"""
 
 async def main():
     # Run the server using stdin/stdout streams
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="annotation-validator",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="annotation-validator",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        if _validator is not None:
+            await _validator.fetcher.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
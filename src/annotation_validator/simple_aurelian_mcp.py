@@ -9,8 +9,17 @@ proven paper fetching capabilities.
 import asyncio
 import json
 import logging
+import multiprocessing
+import os
 import re
-from typing import Any, Dict, List, Optional
+import string
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
@@ -22,66 +31,305 @@ from mcp.types import (
 
 from aurelian.utils.pubmed_utils import get_pmid_text
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import ahocorasick  # optional: single-pass exact matching of many supporting texts
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 # Create the MCP server
 server = Server("simple-aurelian-annotation-validator")
 
+class _LRUCache(OrderedDict):
+    """Dict that drops its least recently used entries beyond maxsize."""
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+# Papers kept in memory; a long-running server would otherwise hold every paper it has seen
+PAPER_CACHE_SIZE = 256
+
 # Paper cache to avoid repeated fetches
-paper_cache = {}
+paper_cache: Dict[str, str] = _LRUCache(PAPER_CACHE_SIZE)
+
+# Papers are also kept on disk across restarts, in the same files as the CLI's cache
+PAPER_CACHE_DIR = Path("~/.cache/annotation_validator/pmid").expanduser()
+PAPER_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+# Fetches in progress, so concurrent callers for one PMID share a single request
+_inflight_fetches: Dict[str, asyncio.Task] = {}
+
+# Papers fetched at once when validating or caching many references
+MAX_CONCURRENT_FETCHES = 8
+
+# get_pmid_text blocks on the network, so it gets its own threads; this bounds
+# parallel pressure on NCBI and leaves the default executor to disk cache I/O
+_aurelian_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix="aurelian")
+
+# Worker processes for matching several papers in parallel, started on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+# Characters of not-yet-indexed paper text below which matching in-process
+# (roughly 5 MB/s) beats spawning workers and pickling the papers to them
+PROCESS_POOL_MIN_CHARS = 5_000_000
+
+# Tokenization patterns, compiled once
+_WORD_RE = re.compile(r'\b\w+\b')
+# Sentences end at '.', '!' or '?'; mapping all three to '.' lets str.split do the splitting
+_SENTENCE_END_TABLE = str.maketrans({"!": ".", "?": "."})
+# For ASCII text \w is exactly [A-Za-z0-9_], so mapping every other ASCII
+# character to a space and splitting yields the same words as _WORD_RE
+_ASCII_NON_WORD_TABLE = str.maketrans({
+    chr(c): " " for c in range(128) if chr(c) not in string.ascii_letters + string.digits + "_"
+})
+
+# A title candidate: a line longer than 20 characters containing a '.'
+_TITLE_LINE_RE = re.compile(r'^(?=[^\n]*\.)[^\n]{21,}', re.MULTILINE)
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into words, as _WORD_RE.findall would."""
+    if text.isascii():
+        return text.translate(_ASCII_NON_WORD_TABLE).split()
+    return _WORD_RE.findall(text)
+
+class PaperIndex:
+    """Paper text plus the derived forms used for matching and display.
+    
+    Each form is computed on first use. The word and sentence indexes are
+    only needed once a supporting text falls back to word-overlap matching,
+    so papers whose texts all match exactly are never tokenized.
+    """
+    
+    def __init__(self, paper_text: str):
+        self.text = paper_text
+    
+    @cached_property
+    def lower(self) -> str:
+        """The paper lowercased, for exact matching."""
+        return self.text.lower()
+    
+    @cached_property
+    def title(self) -> str:
+        """The paper's title line, as extract_title_from_text finds it."""
+        return extract_title_from_text(self.text)
+    
+    @cached_property
+    def words(self) -> frozenset:
+        """Lowercased words of the whole paper."""
+        return frozenset(_tokenize(self.lower))
+    
+    @cached_property
+    def sentences(self) -> List[str]:
+        """The paper split into sentences, in original case.
+        
+        Runs of terminators (e.g. '...') leave empty strings; having no words,
+        they never score as a best-matching sentence.
+        """
+        return self.text.translate(_SENTENCE_END_TABLE).split(".")
+    
+    @cached_property
+    def word_sentences(self) -> Dict[str, List[int]]:
+        """Lowercased word -> indexes of the sentences containing it."""
+        word_sentences: Dict[str, List[int]] = {}
+        for i, sentence in enumerate(self.sentences):
+            for word in set(_tokenize(sentence.lower())):
+                word_sentences.setdefault(word, []).append(i)
+        return word_sentences
+
+@dataclass(slots=True)
+class TextValidationResult:
+    """Result of validating one supporting text from an annotation file."""
+    hpo_id: str
+    hpo_name: str
+    text: str
+    reference: str
+    found: bool
+    confidence: float
+    section: str
+
+# Paper indexes, created on first use of each paper
+paper_index_cache: Dict[str, PaperIndex] = _LRUCache(PAPER_CACHE_SIZE)
+
+def get_paper_index(pmid: str, paper_text: str) -> PaperIndex:
+    """Return the cached index for a paper, building it on first use.
+    
+    paper_cache and paper_index_cache evict independently, so an index is
+    only reused if it was built from this very text.
+    """
+    index = paper_index_cache.get(pmid)
+    if index is None or index.text is not paper_text:
+        index = PaperIndex(paper_text)
+        paper_index_cache[pmid] = index
+    return index
+
+def _has_paper_index(pmid: str, paper_text: str) -> bool:
+    """Whether get_paper_index would reuse a cached index for this paper."""
+    index = paper_index_cache.get(pmid)
+    return index is not None and index.text is paper_text
+
+# Match results by (supporting text, reference), so re-submitted texts skip matching
+MATCH_CACHE_SIZE = 4096
+match_cache: Dict[Tuple[str, str], tuple[bool, float, str]] = _LRUCache(MATCH_CACHE_SIZE)
 
 async def fetch_paper_text(pmid: str) -> Optional[str]:
     """Fetch paper text using aurelian's utilities."""
     if pmid in paper_cache:
         return paper_cache[pmid]
     
+    # Join a fetch already in progress for this PMID instead of starting another
+    task = _inflight_fetches.get(pmid)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_uncached_paper_text(pmid))
+        _inflight_fetches[pmid] = task
+        task.add_done_callback(lambda _: _inflight_fetches.pop(pmid, None))
+    # Shielded so one caller being cancelled doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+def _get_paper_cache_file(pmid: str) -> Path:
+    """Get the disk cache file path for a PMID."""
+    clean_pmid = pmid.replace("PMID:", "")
+    return PAPER_CACHE_DIR / f"PMID_{clean_pmid}.txt"
+
+def _load_paper_from_disk(pmid: str) -> Optional[str]:
+    """Load paper text from the disk cache if present and not expired."""
+    cache_file = _get_paper_cache_file(pmid)
     try:
+        if time.time() - cache_file.stat().st_mtime > PAPER_CACHE_MAX_AGE:
+            return None
+        return cache_file.read_text(encoding="utf-8") or None
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Could not load cache for %s: %s", pmid, e)
+        return None
+
+def _save_paper_to_disk(pmid: str, text: str) -> None:
+    """Save paper text to the disk cache."""
+    cache_file = _get_paper_cache_file(pmid)
+    # Write to a temporary file and rename it into place, so readers never see a partial file
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        PAPER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(text, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.warning("Could not save cache for %s: %s", pmid, e)
+        tmp_file.unlink(missing_ok=True)
+
+async def _fetch_uncached_paper_text(pmid: str) -> Optional[str]:
+    """Fetch a paper missing from paper_cache, from disk or aurelian, caching it on success."""
+    try:
+        text = await asyncio.to_thread(_load_paper_from_disk, pmid)
+        if text:
+            paper_cache[pmid] = text
+            return text
+        
         # Use aurelian's get_pmid_text which handles full text + fallback
-        text = await asyncio.to_thread(get_pmid_text, pmid)
+        text = await asyncio.get_running_loop().run_in_executor(_aurelian_pool, get_pmid_text, pmid)
         if text:
             paper_cache[pmid] = text
-            logger.info(f"Successfully fetched {pmid} ({len(text)} characters)")
+            await asyncio.to_thread(_save_paper_to_disk, pmid, text)
+            logger.info("Successfully fetched %s (%d characters)", pmid, len(text))
             return text
         else:
-            logger.warning(f"No text found for {pmid}")
+            logger.warning("No text found for %s", pmid)
             return None
     except Exception as e:
-        logger.error(f"Error fetching {pmid}: {e}")
+        logger.error("Error fetching %s: %s", pmid, e)
         return None
 
+async def fetch_papers(pmids: List[str]) -> Dict[str, Optional[str]]:
+    """Fetch several papers concurrently, at most MAX_CONCURRENT_FETCHES at a time."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    
+    async def bounded_fetch(pmid: str) -> Optional[str]:
+        async with semaphore:
+            return await fetch_paper_text(pmid)
+    
+    texts = await asyncio.gather(*(bounded_fetch(pmid) for pmid in pmids))
+    return dict(zip(pmids, texts))
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text to width characters, marking the cut with '...'."""
+    return text[:width] + "..." if len(text) > width else text
+
 def extract_title_from_text(text: str) -> str:
     """Extract title from paper text."""
-    lines = text.split('\n')
-    for line in lines[:10]:  # Check first 10 lines
-        if line.strip() and len(line) > 20 and '.' in line:
-            return line.strip()
-    return "No title found"
+    # Only the first 10 lines are checked; find where they end rather than
+    # splitting (and copying) the rest of the paper
+    end = -1
+    for _ in range(10):
+        end = text.find('\n', end + 1)
+        if end == -1:
+            end = len(text)
+            break
+    match = _TITLE_LINE_RE.search(text, 0, end)
+    return match.group().strip() if match else "No title found"
 
-def find_supporting_text_in_paper(supporting_text: str, paper_text: str) -> tuple[bool, float, str]:
-    """Find supporting text in paper with context."""
+def find_exact_matches(patterns: List[str], paper_lower: str) -> Dict[str, int]:
+    """Map each pattern that occurs in paper_lower to the position of its first occurrence.
     
-    # Normalize text for comparison
-    supporting_lower = supporting_text.lower()
-    paper_lower = paper_text.lower()
+    Several patterns are found in a single Aho-Corasick pass when pyahocorasick
+    is installed; otherwise each is looked up with str.find.
+    """
+    unique_patterns = list(dict.fromkeys(patterns))
+    positions = {}
+    if ahocorasick is None or len(unique_patterns) < 2:
+        for pattern in unique_patterns:
+            pos = paper_lower.find(pattern)
+            if pos != -1:
+                positions[pattern] = pos
+        return positions
     
-    # Try exact match first
-    if supporting_lower in paper_lower:
+    automaton = ahocorasick.Automaton()
+    for pattern in unique_patterns:
+        if pattern:
+            automaton.add_word(pattern, pattern)
+        else:
+            positions[pattern] = 0  # the empty string matches at the start, as with str.find
+    automaton.make_automaton()
+    # Matches come in order of end position, so a pattern's first hit is its earliest occurrence
+    for end, pattern in automaton.iter(paper_lower):
+        if pattern not in positions:
+            positions[pattern] = end - len(pattern) + 1
+            if len(positions) == len(unique_patterns):
+                break
+    return positions
+
+def _match_supporting_text(supporting_text: str, supporting_lower: str, index: PaperIndex,
+                           match_pos: Optional[int]) -> tuple[bool, float, str]:
+    """Score one supporting text against a paper, given its exact-match position (if any)."""
+    paper_text = index.text
+    
+    # Exact match first
+    if match_pos is not None:
         # Find the context around the match
-        match_pos = paper_lower.find(supporting_lower)
         start = max(0, match_pos - 100)
         end = min(len(paper_text), match_pos + len(supporting_text) + 100)
         context = paper_text[start:end].strip()
         return True, 1.0, context
     
     # Try partial word matching
-    supporting_words = re.findall(r'\b\w+\b', supporting_lower)
+    supporting_words = _tokenize(supporting_lower)
     if len(supporting_words) < 2:
         return False, 0.0, ""
     
     # Count how many words match
-    paper_words = set(re.findall(r'\b\w+\b', paper_lower))
+    paper_words = index.words
     matched_words = [word for word in supporting_words if word in paper_words]
     
     if len(matched_words) == 0:
@@ -91,24 +339,107 @@ def find_supporting_text_in_paper(supporting_text: str, paper_text: str) -> tupl
     
     # If confidence is high enough, find best matching sentence
     if confidence > 0.7:
-        sentences = re.split(r'[.!?]+', paper_text)
-        best_sentence = ""
-        best_sentence_score = 0
+        # Only sentences sharing a word with the supporting text can score, so
+        # count matches per sentence from the word -> sentences index
+        sentence_matches: Dict[int, int] = {}
+        for word in supporting_words:
+            for i in index.word_sentences.get(word, ()):
+                sentence_matches[i] = sentence_matches.get(i, 0) + 1
         
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            sentence_words = set(re.findall(r'\b\w+\b', sentence_lower))
-            sentence_matches = [word for word in supporting_words if word in sentence_words]
-            sentence_score = len(sentence_matches) / len(supporting_words) if supporting_words else 0
-            
-            if sentence_score > best_sentence_score:
-                best_sentence_score = sentence_score
-                best_sentence = sentence.strip()
+        best_sentence = ""
+        if sentence_matches:
+            # Most matched words wins; ties go to the earliest sentence
+            best = min(sentence_matches, key=lambda i: (-sentence_matches[i], i))
+            best_sentence = index.sentences[best].strip()
         
         return confidence > 0.8, confidence, best_sentence
     
     return False, confidence, ""
 
+def find_supporting_texts_in_paper(supporting_texts: List[str], paper_text: str,
+                                   index: Optional[PaperIndex] = None) -> List[tuple[bool, float, str]]:
+    """Find several supporting texts in one paper, scanning it once for exact matches.
+    
+    Returns one (found, confidence, context) tuple per supporting text, in order.
+    """
+    if index is None:
+        index = PaperIndex(paper_text)
+    
+    # Normalize text for comparison
+    supporting_lowers = [supporting_text.lower() for supporting_text in supporting_texts]
+    positions = find_exact_matches(supporting_lowers, index.lower)
+    return [
+        _match_supporting_text(supporting_text, supporting_lower, index, positions.get(supporting_lower))
+        for supporting_text, supporting_lower in zip(supporting_texts, supporting_lowers)
+    ]
+
+def find_supporting_text_in_paper(supporting_text: str, paper_text: str,
+                                  index: Optional[PaperIndex] = None) -> tuple[bool, float, str]:
+    """Find supporting text in paper with context.
+    
+    Pass the paper's index (see get_paper_index) when validating several
+    texts against the same paper, so it is only tokenized once.
+    """
+    return find_supporting_texts_in_paper([supporting_text], paper_text, index)[0]
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared matching pool, starting it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        # spawn rather than fork: the server process already runs to_thread workers
+        _process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _process_pool
+
+async def validate_entries(entries: List[Tuple[str, str]]) -> List[Optional[tuple[bool, float, str]]]:
+    """Validate (text, reference) pairs, grouping them by paper.
+    
+    Papers are fetched concurrently, and each is scanned once for all of its
+    supporting texts, using its cached index where there is one. Only when
+    several papers still need indexing, their text adds up to at least
+    PROCESS_POOL_MIN_CHARS and more than one core is available are those
+    papers matched in worker processes, in parallel with the rest. Entries
+    whose paper could not be fetched get None. Pairs validated before are
+    answered from match_cache without fetching or scanning anything.
+    """
+    matches: List[Optional[tuple[bool, float, str]]] = [match_cache.get(entry) for entry in entries]
+    by_reference: Dict[str, List[int]] = {}
+    for position, (_, reference) in enumerate(entries):
+        if matches[position] is None:
+            by_reference.setdefault(reference, []).append(position)
+    
+    paper_texts = await fetch_papers(list(by_reference))
+    groups = [
+        (reference, positions, [entries[position][0] for position in positions])
+        for reference, positions in by_reference.items() if paper_texts[reference]
+    ]
+    
+    # Worker processes only pay off for a lot of unindexed text and more than one core;
+    # papers with a cached index are always cheapest to match here
+    unindexed = {reference for reference, _, _ in groups
+                 if not _has_paper_index(reference, paper_texts[reference])}
+    pending = {}
+    if (len(unindexed) > 1 and (os.cpu_count() or 1) > 1
+            and sum(len(paper_texts[reference]) for reference in unindexed) >= PROCESS_POOL_MIN_CHARS):
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        pending = {
+            reference: loop.run_in_executor(pool, find_supporting_texts_in_paper, texts, paper_texts[reference])
+            for reference, _, texts in groups if reference in unindexed
+        }
+    
+    group_matches = {
+        reference: find_supporting_texts_in_paper(texts, paper_texts[reference], get_paper_index(reference, paper_texts[reference]))
+        for reference, _, texts in groups if reference not in pending
+    }
+    for reference, future in pending.items():
+        group_matches[reference] = await future
+    
+    for reference, positions, _ in groups:
+        for position, match in zip(positions, group_matches[reference]):
+            matches[position] = match
+            match_cache[entries[position]] = match
+    return matches
+
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
     """List available validation tools."""
@@ -215,7 +546,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
         paper_text = await fetch_paper_text(pmid)
         
         if paper_text:
-            title = extract_title_from_text(paper_text)
+            title = get_paper_index(pmid, paper_text).title
             response = f"""Paper Fetched: {pmid}
 
 Title: {title}
@@ -224,7 +555,7 @@ Content Length: {len(paper_text)} characters
 Has Full Text: {'Yes' if len(paper_text) > 5000 else 'Likely abstract only'}
 
 Preview:
-{paper_text[:800]}{'...' if len(paper_text) > 800 else ''}"""
+{_truncate(paper_text, 800)}"""
         else:
             response = f"✗ Could not fetch paper: {pmid}"
         
@@ -241,18 +572,23 @@ Preview:
             return [TextContent(type="text", text=response)]
         
         # Find supporting text
-        found, confidence, context = find_supporting_text_in_paper(supporting_text, paper_text)
+        index = get_paper_index(pmid, paper_text)
+        match = match_cache.get((supporting_text, pmid))
+        if match is None:
+            match = find_supporting_text_in_paper(supporting_text, paper_text, index)
+            match_cache[(supporting_text, pmid)] = match
+        found, confidence, context = match
         
         # Format result
         status = "✓ FOUND" if found else "✗ NOT FOUND"
         confidence_icon = "🟢" if confidence > 0.8 else "🟡" if confidence > 0.5 else "🔴"
-        title = extract_title_from_text(paper_text)
+        title = index.title
         
         response = f"""Validation Result: {status} {confidence_icon}
 
 Supporting Text: {supporting_text}
 Reference: {pmid}
-Paper: {title[:80]}{'...' if len(title) > 80 else ''}
+Paper: {_truncate(title, 80)}
 
 Confidence Score: {confidence:.3f}"""
         
@@ -266,21 +602,21 @@ Confidence Score: {confidence:.3f}"""
         hpo_name = arguments["hpo_name"]
         supporting_texts = arguments["supporting_texts"]
         
-        results = []
-        paper_ids = set()
-        
+        entries = []
         for support_entry in supporting_texts:
             text = support_entry.get("text", "")
             reference = support_entry.get("reference", "")
             
             if not text or not reference or not reference.startswith("PMID:"):
                 continue
-                
-            paper_ids.add(reference)
-            
-            # Fetch paper
-            paper_text = await fetch_paper_text(reference)
-            if not paper_text:
+            entries.append((text, reference))
+        
+        paper_ids = {reference for _, reference in entries}
+        results = []
+        
+        # Fetch each paper once and match all of its supporting texts together
+        for (text, reference), match in zip(entries, await validate_entries(entries)):
+            if match is None:
                 results.append({
                     "text": text[:50] + "...",
                     "reference": reference,
@@ -290,14 +626,13 @@ Confidence Score: {confidence:.3f}"""
                 })
                 continue
             
-            # Validate
-            found, confidence, context = find_supporting_text_in_paper(text, paper_text)
+            found, confidence, context = match
             results.append({
-                "text": text[:50] + "..." if len(text) > 50 else text,
+                "text": _truncate(text, 50),
                 "reference": reference,
                 "found": found,
                 "confidence": confidence,
-                "context": context[:100] + "..." if len(context) > 100 else context
+                "context": _truncate(context, 100)
             })
         
         # Calculate summary
@@ -305,7 +640,8 @@ Confidence Score: {confidence:.3f}"""
         found_count = sum(1 for r in results if r["found"])
         avg_confidence = sum(r["confidence"] for r in results) / total if total > 0 else 0
         
-        response = f"""HPO Annotation Validation: {hpo_id} ({hpo_name})
+        # Collect the pieces and join once rather than growing one string
+        parts = [f"""HPO Annotation Validation: {hpo_id} ({hpo_name})
 
 📊 Summary:
 - Total supporting texts: {total}
@@ -313,21 +649,21 @@ Confidence Score: {confidence:.3f}"""
 - Average confidence: {avg_confidence:.3f}
 - Papers used: {len(paper_ids)}
 
-📋 Results:"""
+📋 Results:"""]
         
         for i, result in enumerate(results, 1):
             status = "✓" if result["found"] else "✗"
             conf_icon = "🟢" if result["confidence"] > 0.8 else "🟡" if result["confidence"] > 0.5 else "🔴"
-            response += f"\n{i}. {status} {conf_icon} {result['reference']}"
-            response += f"\n   Text: {result['text']}"
-            response += f"\n   Confidence: {result['confidence']:.3f}"
+            parts.append(f"\n{i}. {status} {conf_icon} {result['reference']}")
+            parts.append(f"\n   Text: {result['text']}")
+            parts.append(f"\n   Confidence: {result['confidence']:.3f}")
             if result.get("context"):
-                response += f"\n   Context: {result['context']}"
+                parts.append(f"\n   Context: {result['context']}")
             if result.get("error"):
-                response += f"\n   Error: {result['error']}"
-            response += "\n"
+                parts.append(f"\n   Error: {result['error']}")
+            parts.append("\n")
         
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="".join(parts))]
     
     elif name == "validate_annotation_file":
         annotation_data = arguments["annotation_data"]
@@ -341,12 +677,13 @@ Confidence Score: {confidence:.3f}"""
         # Process all sections
         sections = ['phenotypic_features', 'inheritance', 'clinical_course']
         
+        # Collect every supporting text first, so each paper is scanned once for all of them
+        entries = []
         for section_name in sections:
             if section_name not in annotation_data:
                 continue
             
             section = annotation_data[section_name]
-            section_results = []
             
             for annotation in section:
                 hpo_id = annotation.get("hpo_id", "")
@@ -356,50 +693,53 @@ Confidence Score: {confidence:.3f}"""
                 if not supporting_texts:
                     continue
                 
-                # Validate each supporting text
                 for support_entry in supporting_texts:
                     text = support_entry.get("text", "")
                     reference = support_entry.get("reference", "")
                     
                     if not text or not reference or not reference.startswith("PMID:"):
                         continue
-                    
-                    # Fetch and validate
-                    paper_text = await fetch_paper_text(reference)
-                    if paper_text:
-                        found, confidence, context = find_supporting_text_in_paper(text, paper_text)
-                        result = {
-                            "hpo_id": hpo_id,
-                            "hpo_name": hpo_name,
-                            "text": text,
-                            "reference": reference,
-                            "found": found,
-                            "confidence": confidence,
-                            "section": section_name
-                        }
-                        section_results.append(result)
-                        all_results.append(result)
-            
-            # Section summary
-            if section_results:
-                section_found = sum(1 for r in section_results if r["found"])
-                section_total = len(section_results)
-                section_summaries[section_name] = {
-                    "found": section_found,
-                    "total": section_total,
-                    "rate": section_found / section_total if section_total > 0 else 0
-                }
+                    entries.append((section_name, hpo_id, hpo_name, text, reference))
+        
+        # Fetch and validate
+        results_by_section: Dict[str, List[TextValidationResult]] = {}
+        matches = await validate_entries([(text, reference) for *_, text, reference in entries])
+        for (section_name, hpo_id, hpo_name, text, reference), match in zip(entries, matches):
+            if match is None:
+                continue
+            found, confidence, _ = match
+            result = TextValidationResult(
+                hpo_id=hpo_id,
+                hpo_name=hpo_name,
+                text=text,
+                reference=reference,
+                found=found,
+                confidence=confidence,
+                section=section_name,
+            )
+            results_by_section.setdefault(section_name, []).append(result)
+            all_results.append(result)
+        
+        # Section summaries, for sections with at least one validated text
+        for section_name, section_results in results_by_section.items():
+            section_found = sum(1 for r in section_results if r.found)
+            section_total = len(section_results)
+            section_summaries[section_name] = {
+                "found": section_found,
+                "total": section_total,
+                "rate": section_found / section_total if section_total > 0 else 0
+            }
         
         # Overall summary
         total_annotations = len(all_results)
-        total_found = sum(1 for r in all_results if r["found"])
+        total_found = sum(1 for r in all_results if r.found)
         overall_rate = total_found / total_annotations if total_annotations > 0 else 0
-        avg_confidence = sum(r["confidence"] for r in all_results) / total_annotations if total_annotations > 0 else 0
+        avg_confidence = sum(r.confidence for r in all_results) / total_annotations if total_annotations > 0 else 0
         
         # Unique papers
-        unique_papers = set(r["reference"] for r in all_results)
+        unique_papers = set(r.reference for r in all_results)
         
-        response = f"""Annotation File Validation: {disease_name} ({disease_id})
+        parts = [f"""Annotation File Validation: {disease_name} ({disease_id})
 
 📊 Overall Results:
 - Total annotations: {total_annotations}
@@ -407,17 +747,17 @@ Confidence Score: {confidence:.3f}"""
 - Average confidence: {avg_confidence:.3f}
 - Unique papers: {len(unique_papers)}
 
-📋 Section Breakdown:"""
+📋 Section Breakdown:"""]
         
         for section_name, summary in section_summaries.items():
-            response += f"\n- {section_name.replace('_', ' ').title()}: {summary['found']}/{summary['total']} ({summary['rate']*100:.1f}%)"
+            parts.append(f"\n- {section_name.replace('_', ' ').title()}: {summary['found']}/{summary['total']} ({summary['rate']*100:.1f}%)")
         
         # Show papers used
-        response += f"\n\n📄 Papers Used:\n"
+        parts.append("\n\n📄 Papers Used:\n")
         for paper in sorted(unique_papers):
-            response += f"- {paper}\n"
+            parts.append(f"- {paper}\n")
         
-        return [TextContent(type="text", text=response)]
+        return [TextContent(type="text", text="".join(parts))]
     
     elif name == "cache_papers_from_annotation":
         annotation_data = arguments["annotation_data"]
@@ -442,11 +782,11 @@ Confidence Score: {confidence:.3f}"""
         success_count = 0
         results = []
         
-        for pmid in sorted(pmids):
-            paper_text = await fetch_paper_text(pmid)
+        paper_texts = await fetch_papers(sorted(pmids))
+        for pmid, paper_text in paper_texts.items():
             if paper_text:
                 success_count += 1
-                title = extract_title_from_text(paper_text)[:60]
+                title = get_paper_index(pmid, paper_text).title[:60]
                 results.append(f"✓ {pmid}: {title}...")
             else:
                 results.append(f"✗ {pmid}: Failed to fetch")
@@ -466,19 +806,27 @@ Results:
 
 async def main():
     """Run the simple aurelian MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="simple-aurelian-annotation-validator",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    # Configure logging here rather than at import, so importing this module
+    # as a library leaves the root logger alone
+    logging.basicConfig(level=logging.INFO)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="simple-aurelian-annotation-validator",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        _aurelian_pool.shutdown(wait=False)
+        if _process_pool is not None:
+            _process_pool.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
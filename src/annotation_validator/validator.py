@@ -2,12 +2,48 @@
 Core validation logic for annotations.
 """
 
+import asyncio
+import functools
 import re
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Any, List, Tuple, Optional, Union
+from dataclasses import dataclass, replace
 
 from .fetcher import PMIDFetcher
 
+try:
+    import ahocorasick  # optional: single-pass disease keyword scan
+except ImportError:
+    ahocorasick = None
+
+# Text normalization patterns, compiled once
+_WS_RE = re.compile(r'\s+')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_QUOTE_TABLE = str.maketrans({
+    '\u201c': '"', '\u201d': '"',  # curly double quotes
+    '\u2018': "'", '\u2019': "'",  # curly single quotes
+})
+
+# Validation results kept per (supporting text, PMID, keywords)
+RESULT_CACHE_SIZE = 10_000
+# Publications kept in prepared (normalized and tokenized) form
+PREPARED_CACHE_SIZE = 1024
+# Distinct keyword lists kept in prepared form, each with its own automaton
+KEYWORD_CACHE_SIZE = 256
+# Strings up to this length (keywords, supporting texts) are memoized by
+# normalize_text; publication text is normalized once per PMID by _prepare
+# and would only pin large strings in the memo
+NORMALIZE_CACHE_MAX_LENGTH = 1000
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize text for comparison."""
+    return _WS_RE.sub(' ', text.strip()).translate(_QUOTE_TABLE).lower()
+
+
+# The same short strings are normalized over and over across annotations
+_normalize_short_text = functools.lru_cache(maxsize=4096)(_normalize_text)
+
 
 @dataclass
 class ValidationResult:
@@ -21,18 +57,45 @@ class ValidationResult:
     publication_abstract: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class KeywordSet:
+    """Disease keywords in the form check_disease_relevance matches them.
+    
+    Build one with AnnotationValidator.prepare_keywords to reuse it across
+    many relevance checks.
+    """
+    normalized: Tuple[str, ...]
+    automaton: Any = None  # Aho-Corasick automaton over the keywords, if pyahocorasick is installed
+    
+    def __len__(self) -> int:
+        return len(self.normalized)
+
+
+@dataclass
+class PreparedContent:
+    """Publication content plus the derived forms used for matching."""
+    raw: str
+    normalized: str
+    sentence_words: List[frozenset]  # word set per candidate sentence
+
+
 class AnnotationValidator:
     """Validate annotations against publications."""
     
     def __init__(self, fetcher: Optional[PMIDFetcher] = None):
         self.fetcher = fetcher or PMIDFetcher()
+        # Least recently used first; the same annotation is often validated repeatedly
+        self._result_cache: "OrderedDict[Tuple[str, str, Tuple[str, ...]], ValidationResult]" = OrderedDict()
+        # Keyword lists -> their prepared form, least recently used first; a disease's keywords rarely change
+        self._keyword_sets: "OrderedDict[Tuple[str, ...], KeywordSet]" = OrderedDict()
+        # PMID -> prepared publication text, least recently used first
+        self._prepared: "OrderedDict[str, PreparedContent]" = OrderedDict()
     
     def normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
-        text = re.sub(r'\s+', ' ', text.strip())
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-        return text.lower()
+        if len(text) <= NORMALIZE_CACHE_MAX_LENGTH:
+            return _normalize_short_text(text)
+        return _normalize_text(text)
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate simple similarity score between two texts."""
@@ -42,47 +105,113 @@ class AnnotationValidator:
         if not words1 or not words2:
             return 0.0
         
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union)
+        # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never built
+        overlap = len(words1 & words2)
+        return overlap / (len(words1) + len(words2) - overlap)
     
-    def check_disease_relevance(self, content: str, disease_keywords: List[str]) -> Tuple[bool, float]:
+    def check_disease_relevance(self, content: str,
+                                disease_keywords: Union[KeywordSet, List[str]]) -> Tuple[bool, float]:
         """Check if publication content is relevant to the disease."""
+        return self._check_disease_relevance_normalized(self.normalize_text(content), disease_keywords)
+    
+    def _check_disease_relevance_normalized(self, normalized_content: str,
+                                            disease_keywords: Union[KeywordSet, List[str]]) -> Tuple[bool, float]:
+        """check_disease_relevance for content already passed through normalize_text."""
         if not disease_keywords:
             return True, 1.0
         
-        normalized_content = self.normalize_text(content)
-        
-        matches = 0
-        for keyword in disease_keywords:
-            if self.normalize_text(keyword) in normalized_content:
-                matches += 1
+        if not isinstance(disease_keywords, KeywordSet):
+            disease_keywords = self.prepare_keywords(disease_keywords)
+        keywords = disease_keywords.normalized
+        if disease_keywords.automaton is not None:
+            # One pass over the content finds every keyword occurrence; the
+            # automaton can't hold an empty keyword, which any content contains
+            found = {keyword for _, keyword in disease_keywords.automaton.iter(normalized_content)}
+            matches = sum(1 for keyword in keywords if keyword in found or not keyword)
+        else:
+            matches = sum(1 for keyword in keywords if keyword in normalized_content)
         
-        relevance_score = matches / len(disease_keywords) if disease_keywords else 0.0
+        relevance_score = matches / len(keywords)
         is_relevant = relevance_score >= 0.2
         
         return is_relevant, relevance_score
     
+    def prepare_keywords(self, disease_keywords: List[str]) -> KeywordSet:
+        """Normalize disease keywords for matching, once per distinct keyword list."""
+        key = tuple(disease_keywords)
+        keyword_set = self._keyword_sets.get(key)
+        if keyword_set is None:
+            normalized = tuple(self.normalize_text(keyword) for keyword in key)
+            keyword_set = KeywordSet(normalized, self._build_keyword_automaton(normalized))
+            self._keyword_sets[key] = keyword_set
+            if len(self._keyword_sets) > KEYWORD_CACHE_SIZE:
+                self._keyword_sets.popitem(last=False)
+        self._keyword_sets.move_to_end(key)
+        return keyword_set
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords: Tuple[str, ...]):
+        """Build an Aho-Corasick automaton over the keywords, if pyahocorasick is installed.
+        
+        A single keyword is cheaper to find with a plain substring test, so
+        this returns None unless there are at least two distinct keywords.
+        """
+        unique_keywords = {keyword for keyword in keywords if keyword}
+        if ahocorasick is None or len(unique_keywords) < 2:
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword in unique_keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def prepare_content(self, content: str) -> PreparedContent:
+        """Normalize content and split it into candidate sentence word sets."""
+        normalized = self.normalize_text(content)
+        sentence_words = []
+        for sentence in _SENTENCE_SPLIT_RE.split(normalized):
+            if len(sentence.strip()) >= 10:  # Skip very short sentences
+                sentence_words.append(frozenset(sentence.split()))
+        return PreparedContent(raw=content, normalized=normalized, sentence_words=sentence_words)
+    
+    def _prepare(self, pmid: str, content: str) -> PreparedContent:
+        """Return the prepared form of a publication's content, computing it once."""
+        prepared = self._prepared.get(pmid)
+        if prepared is None or prepared.raw != content:
+            prepared = self.prepare_content(content)
+            self._prepared[pmid] = prepared
+            if len(self._prepared) > PREPARED_CACHE_SIZE:
+                self._prepared.popitem(last=False)
+        self._prepared.move_to_end(pmid)
+        return prepared
+    
     def find_text_in_content(self, supporting_text: str, content: str, threshold: float = 0.7) -> Tuple[bool, float]:
         """Find supporting text in publication content."""
-        normalized_supporting = self.normalize_text(supporting_text)
-        normalized_content = self.normalize_text(content)
-        
+        return self._find_text_in_prepared(self.normalize_text(supporting_text), self.prepare_content(content), threshold)
+    
+    def _find_text_in_prepared(self, normalized_supporting: str, prepared: PreparedContent,
+                               threshold: float = 0.7) -> Tuple[bool, float]:
+        """find_text_in_content for a normalized supporting text and prepared content."""
         # Exact match
-        if normalized_supporting in normalized_content:
+        if normalized_supporting in prepared.normalized:
             return True, 1.0
         
         # Check for high similarity matches in sentences
-        content_sentences = re.split(r'[.!?]+', normalized_content)
         best_similarity = 0.0
+        supporting_words = set(normalized_supporting.split())
+        supporting_size = len(supporting_words)
         
-        for sentence in content_sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 10:
+        for sentence_words in prepared.sentence_words:
+            # Jaccard can't exceed min(|A|, |B|) / max(|A|, |B|); skip sentences
+            # that could neither reach the threshold nor beat the best so far
+            sentence_size = len(sentence_words)
+            bound = min(supporting_size, sentence_size) / max(supporting_size, sentence_size)
+            if bound < threshold and bound <= best_similarity:
                 continue
-                
-            similarity = self.calculate_similarity(normalized_supporting, sentence)
+            
+            # Word-set Jaccard, as in calculate_similarity; both texts are already normalized
+            overlap = len(supporting_words & sentence_words)
+            similarity = overlap / (supporting_size + sentence_size - overlap)
             best_similarity = max(best_similarity, similarity)
             
             if similarity >= threshold:
@@ -103,6 +232,13 @@ class AnnotationValidator:
                 error="Only PMID references supported"
             )
         
+        key = (supporting_text, pmid, tuple(disease_keywords or ()))
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            # A copy, so callers annotating their result don't rewrite the cached one
+            return replace(cached)
+        
         pub_data = await self.fetcher.fetch_abstract(pmid)
         if pub_data is None:
             return ValidationResult(
@@ -110,22 +246,51 @@ class AnnotationValidator:
                 error="Could not fetch publication content"
             )
         
+        # Normalized and split once per publication, for both checks
+        prepared = self._prepare(pmid, pub_data["full_text"])
+        
         # Check disease relevance
         disease_relevant = True
         disease_relevance_score = 1.0
         if disease_keywords:
-            disease_relevant, disease_relevance_score = self.check_disease_relevance(
-                pub_data["full_text"], disease_keywords
+            disease_relevant, disease_relevance_score = self._check_disease_relevance_normalized(
+                prepared.normalized, disease_keywords
             )
         
         # Check text match
-        found, similarity = self.find_text_in_content(supporting_text, pub_data["full_text"])
+        found, similarity = self._find_text_in_prepared(self.normalize_text(supporting_text), prepared)
         
-        return ValidationResult(
+        result = ValidationResult(
             found=found,
             similarity_score=similarity,
             disease_relevant=disease_relevant,
             disease_relevance_score=disease_relevance_score,
             publication_title=pub_data.get("title"),
             publication_abstract=pub_data.get("abstract")
-        )
\ No newline at end of file
+        )
+        
+        # Only completed validations are cached; fetch failures may be transient
+        self._result_cache[key] = result
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return replace(result)
+    
+    async def validate_many(
+        self,
+        items: List[Tuple[str, str, Optional[List[str]]]],
+        max_concurrency: int = 10
+    ) -> List[ValidationResult]:
+        """Validate many (supporting_text, pmid, disease_keywords) items concurrently.
+        
+        All referenced abstracts are fetched up front in batched requests, so
+        each distinct PMID is downloaded once. Results come back in item order.
+        """
+        await self.fetcher.fetch_abstracts_bulk(pmid for _, pmid, _ in items if pmid.startswith("PMID:"))
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def validate_one(item: Tuple[str, str, Optional[List[str]]]) -> ValidationResult:
+            async with semaphore:
+                return await self.validate_annotation(*item)
+        
+        return await asyncio.gather(*(validate_one(item) for item in items))